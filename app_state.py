@@ -4,7 +4,7 @@ Application state manager for the Waveform Analyzer.
 This module manages global and per-waveform state without UI or calculation logic.
 """
 
-from typing import List, Optional, Tuple
+from typing import Any, Callable, List, Optional, Tuple
 
 from config import load_config
 
@@ -86,9 +86,48 @@ class WfState:
         """Return custom name if set, otherwise default name."""
         return self.name if self.name else f"Waveform {self.id + 1}"
 
+    @property
+    def color(self) -> Tuple[int, int, int]:
+        """RGB color tuple (0-255 per channel)."""
+        return self._color
+
+    @color.setter
+    def color(self, value: Tuple[int, int, int]) -> None:
+        """Set the RGB color and precompute its matplotlib and hex forms."""
+        self._color = value
+        self.mpl_color: Tuple[float, float, float] = (
+            value[0] / 255, value[1] / 255, value[2] / 255
+        )
+        self.hex_color: str = '#{:02x}{:02x}{:02x}'.format(*value)
+
+
+class _Observed:
+    """AppState attribute that notifies a topic's subscribers on change."""
+
+    def __init__(self, topic: str):
+        self.topic = topic
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.attr = "_" + name
+
+    def __get__(self, obj: Any, objtype: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        return getattr(obj, self.attr)
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        if getattr(obj, self.attr, None) != value:
+            setattr(obj, self.attr, value)
+            obj._notify(self.topic)
+
 
 class AppState:
-    """Manages global application state."""
+    """Manages global application state.
+
+    Observers can subscribe to two topics: "wfs" is notified when
+    waveforms are added, removed, enabled or disabled, and "env" when
+    an envelope flag or hide_src_wfs changes.
+    """
 
     # Color palette for auto-assignment
     COLORS = [
@@ -102,8 +141,14 @@ class AppState:
     MAX_WFS = 5
     MIN_WFS = 1
 
+    show_max_env = _Observed("env")
+    show_min_env = _Observed("env")
+    show_rms_env = _Observed("env")
+    hide_src_wfs = _Observed("env")
+
     def __init__(self):
         """Initialize application state with default values."""
+        self._subscribers: dict[str, List[Callable[[], None]]] = {}
         self.duration: float = DEFAULT_DURATION  # 0.5-120.0 seconds
         self.sample_rate: int = 1000  # Fixed
         self.active_wf_index: int = 0
@@ -150,6 +195,7 @@ class AppState:
 
         self.wfs.append(new_wf)
         self.active_wf_index = wf_id
+        self._notify("wfs")
 
         return new_wf
 
@@ -177,6 +223,7 @@ class AppState:
         if self.active_wf_index >= len(self.wfs):
             self.active_wf_index = len(self.wfs) - 1
 
+        self._notify("wfs")
         return True
 
     def get_wf(self, wf_id: int) -> Optional[WfState]:
@@ -194,6 +241,19 @@ class AppState:
                 return wf
         return None
 
+    def set_wf_enabled(self, wf_id: int, enabled: bool) -> None:
+        """
+        Enable or disable a waveform.
+
+        Args:
+            wf_id: ID of waveform to change
+            enabled: Whether the waveform is visible
+        """
+        wf = self.get_wf(wf_id)
+        if wf and wf.enabled != enabled:
+            wf.enabled = enabled
+            self._notify("wfs")
+
     def get_active_wf(self) -> Optional[WfState]:
         """
         Get currently active waveform.
@@ -221,7 +281,14 @@ class AppState:
         Returns:
             True if envelopes can be displayed
         """
-        return len(self.get_enabled_wfs()) > 1
+        # Stop at the second enabled waveform instead of building a list
+        enabled = 0
+        for wf in self.wfs:
+            if wf.enabled:
+                enabled += 1
+                if enabled > 1:
+                    return True
+        return False
 
     def set_duration(self, duration: float) -> None:
         """
@@ -232,6 +299,33 @@ class AppState:
         """
         self.duration = max(DURATION_MIN, min(DURATION_MAX, duration))
 
+    def subscribe(self, topic: str, callback: Callable[[], None]) -> None:
+        """
+        Call a function whenever a topic's state changes.
+
+        Args:
+            topic: "wfs" or "env"
+            callback: Function called with no arguments
+        """
+        self._subscribers.setdefault(topic, []).append(callback)
+
+    def unsubscribe(self, topic: str, callback: Callable[[], None]) -> None:
+        """
+        Stop calling a function registered with subscribe.
+
+        Args:
+            topic: "wfs" or "env"
+            callback: The function passed to subscribe
+        """
+        callbacks = self._subscribers.get(topic, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    def _notify(self, topic: str) -> None:
+        """Call the subscribers of a topic."""
+        for callback in self._subscribers.get(topic, ()):
+            callback()
+
 
 # Global singleton instance
 app_state = AppState()
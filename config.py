@@ -11,6 +11,9 @@ from typing import Any
 
 CONFIG_FILENAME = "default.cfg"
 
+# Parsed settings per config path, dropped when the file is saved
+_cache: dict[str, dict[str, Any]] = {}
+
 
 def _get_config_path() -> str:
     """Return path to default.cfg.
@@ -28,10 +31,22 @@ def _get_config_path() -> str:
 def load_config() -> dict[str, Any]:
     """Load configuration from default.cfg.
 
+    The file is parsed once and cached until save_config() rewrites it.
+
     Returns:
-        Dict of configuration values. Missing or invalid keys fall back
-        to built-in defaults.
+        Dict of configuration values, a new copy that callers may modify.
+        Missing or invalid keys fall back to built-in defaults.
     """
+    config_path = _get_config_path()
+    cached = _cache.get(config_path)
+    if cached is None:
+        cached = _read_config(config_path)
+        _cache[config_path] = cached
+    return dict(cached)
+
+
+def _read_config(config_path: str) -> dict[str, Any]:
+    """Parse a config file, falling back to defaults for missing keys."""
     defaults: dict[str, Any] = {
         "duration": 10.0,
         "frequency": 0.2,
@@ -45,7 +60,6 @@ def load_config() -> dict[str, Any]:
         "theme": "dark",
     }
 
-    config_path = _get_config_path()
     if not os.path.exists(config_path):
         return defaults
 
@@ -88,6 +102,7 @@ def save_config(settings: dict[str, Any]) -> bool:
     """
     try:
         config_path = _get_config_path()
+        _cache.pop(config_path, None)
         lines = [
             "# Waveform Analyzer - Default Configuration",
             "# Edit this file to customize startup defaults.",
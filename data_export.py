@@ -12,11 +12,13 @@ from datetime import datetime
 from typing import Any, List, Tuple, Optional
 
 import numpy as np
-from scipy.io import savemat
 
 
 SUPPORTED_EXTENSIONS = ('.csv', '.mat', '.json')
 
+# Rows formatted per write when exporting CSV
+CSV_CHUNK_ROWS = 8192
+
 
 def sanitize_fname(filepath: str, default_ext: str = '.csv') -> str:
     """
@@ -128,25 +130,21 @@ def export_to_csv(
         else:
             return False, "No data to export"
 
-        # Build data rows
-        num_samples = len(time)
-        for i in range(num_samples):
-            row = [f"{time[i]:.6f}"]
-
-            # Add waveform amplitudes
-            for _, _, amp, _ in wfs:
-                row.append(f"{amp[i]:.6f}")
-
-            # Add envelope amplitudes
-            if envs:
-                for _, _, amp in envs:
-                    row.append(f"{amp[i]:.6f}")
-
-            lines.append(",".join(row))
+        # Data columns: time, waveform amplitudes, envelope amplitudes
+        columns = [time] + [amp for _, _, amp, _ in wfs]
+        if envs:
+            columns += [amp for _, _, amp in envs]
 
-        # Write to file
+        # Write the header, then format and write the rows a chunk at a
+        # time so the whole file is never held in memory as text. Each
+        # chunk is formatted by a single %-operation over its values.
+        row_fmt = "\n" + ",".join(["%.6f"] * len(columns))
         with open(filename, 'w', newline='', encoding='utf-8') as f:
             f.write("\n".join(lines))
+            for start in range(0, len(time), CSV_CHUNK_ROWS):
+                stop = start + CSV_CHUNK_ROWS
+                chunk = np.column_stack([col[start:stop] for col in columns])
+                f.write(row_fmt * len(chunk) % tuple(chunk.ravel().tolist()))
 
         return True, f"Successfully exported to {filename}"
 
@@ -178,6 +176,9 @@ def export_to_mat(
     Returns:
         Tuple of (success: bool, message: str)
     """
+    # Deferred: scipy.io is only needed for .mat exports
+    from scipy.io import savemat
+
     try:
         filename = sanitize_fname(filename, default_ext='.mat')
 
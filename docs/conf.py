@@ -1,11 +1,5 @@
 # Configuration file for the Sphinx documentation builder.
 
-import os
-import sys
-
-# Add project root to sys.path so Sphinx can import modules
-sys.path.insert(0, os.path.abspath('..'))
-
 # -- Project information -----------------------------------------------------
 
 project = 'Waveform Analyzer'
@@ -16,36 +10,35 @@ release = '1.1.0'
 # -- General configuration ---------------------------------------------------
 
 extensions = [
-    'sphinx.ext.autodoc',
+    'autoapi.extension',
     'sphinx.ext.napoleon',
-    'sphinx.ext.viewcode',
     'sphinx.ext.intersphinx',
 ]
 
 templates_path = ['_templates']
-exclude_patterns = ['_build', 'Thumbs.db', '.DS_Store']
+exclude_patterns = [
+    '_build', 'Thumbs.db', '.DS_Store',
+    '**/__pycache__', '**/*.pyc', '.git', 'venv', '.venv', 'node_modules', '.tox',
+]
 
 # -- Options for HTML output -------------------------------------------------
 
 html_theme = 'sphinx_rtd_theme'
 html_static_path = []
+# Don't copy .rst sources into the output or link to them from each page
+html_copy_source = False
+html_show_sourcelink = False
 
-# -- autodoc configuration --------------------------------------------------
+# -- AutoAPI configuration --------------------------------------------------
+# Sources are parsed statically, so no project module (or its GUI/numeric
+# dependencies) is imported during the build. The per-module pages use the
+# ``autoapimodule`` directive instead of generated API pages.
 
+autoapi_dirs = ['..']
+autoapi_ignore = ['*/docs/*', '*/tests/*', '*/build/*', '*/env/*', '*/venv/*', '*/.venv/*']
+autoapi_generate_api_docs = False
+autoapi_add_toctree_entry = False
 autodoc_member_order = 'bysource'
-autodoc_mock_imports = [
-    'customtkinter',
-    'CTkMenuBar',
-    'matplotlib',
-    'matplotlib.pyplot',
-    'matplotlib.backends',
-    'matplotlib.backends.backend_tkagg',
-    'matplotlib.backends._backend_tk',
-    'matplotlib.figure',
-    'tkinter',
-    'numpy',
-    'scipy',
-]
 
 # -- Napoleon configuration (Google-style docstrings) ------------------------
 
@@ -56,8 +49,16 @@ napoleon_include_private_with_doc = False
 
 # -- Intersphinx configuration -----------------------------------------------
 
+# Each project's inventory is read from docs/_inventories first (run
+# "make inventories" to refresh them); the URL is only fetched if the local
+# file is missing.
 intersphinx_mapping = {
-    'python': ('https://docs.python.org/3', None),
-    'numpy': ('https://numpy.org/doc/stable/', None),
-    'scipy': ('https://docs.scipy.org/doc/scipy/', None),
+    'python': ('https://docs.python.org/3', ('_inventories/python.inv', None)),
+    'numpy': ('https://numpy.org/doc/stable/', ('_inventories/numpy.inv', None)),
+    'scipy': ('https://docs.scipy.org/doc/scipy/', ('_inventories/scipy.inv', None)),
 }
+# Fetched inventories are stored in the doctree environment
+# (build/sphinx/doctrees); reuse them for a month before re-downloading
+# and don't let an unreachable host stall the build.
+intersphinx_cache_limit = 30
+intersphinx_timeout = 10
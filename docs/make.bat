@@ -7,6 +7,9 @@ REM Command file for Sphinx documentation
 if "%SPHINXBUILD%" == "" (
 	set SPHINXBUILD=sphinx-build
 )
+if "%SPHINXOPTS%" == "" (
+	set SPHINXOPTS=-j auto
+)
 set SOURCEDIR=.
 set BUILDDIR=..\build\sphinx
 
@@ -24,10 +27,19 @@ if errorlevel 9009 (
 )
 
 if "%1" == "" goto help
+if "%1" == "inventories" goto inventories
 
 %SPHINXBUILD% -M %1 %SOURCEDIR% %BUILDDIR% %SPHINXOPTS% %O%
 goto end
 
+:inventories
+REM Refresh the intersphinx inventories read by conf.py from _inventories\
+if not exist _inventories mkdir _inventories
+curl -fsSL -o _inventories\python.inv https://docs.python.org/3/objects.inv || goto end
+curl -fsSL -o _inventories\numpy.inv https://numpy.org/doc/stable/objects.inv || goto end
+curl -fsSL -o _inventories\scipy.inv https://docs.scipy.org/doc/scipy/objects.inv
+goto end
+
 :help
 %SPHINXBUILD% -M help %SOURCEDIR% %BUILDDIR% %SPHINXOPTS% %O%
 
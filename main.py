@@ -4,13 +4,41 @@ Waveform Analyzer - Main Entry Point
 This module initializes CustomTkinter and runs the application.
 """
 
-from ui_components import WaveformApp
+import tkinter as tk
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from ui_components import WaveformApp
+
+_app_instance: Optional["WaveformApp"] = None
+
+
+def _is_alive(app: "WaveformApp") -> bool:
+    """Return whether the window has not been destroyed."""
+    try:
+        return bool(app.winfo_exists())
+    except tk.TclError:  # Tk commands fail once the root is destroyed
+        return False
+
+
+def get_app() -> "WaveformApp":
+    """Return the application window, creating it on first use.
+
+    Creating the CTk root is expensive (font enumeration, theme loading),
+    so repeated callers share a single WaveformApp instance. A new one is
+    created if the shared window has been destroyed.
+    """
+    global _app_instance
+    if _app_instance is None or not _is_alive(_app_instance):
+        # Imported here so the GUI/plotting stack loads only when the app runs
+        from ui_components import WaveformApp
+        _app_instance = WaveformApp()
+    return _app_instance
 
 
 def main():
     """Initialize and run the application."""
-    app = WaveformApp()
-    app.mainloop()
+    get_app().mainloop()
 
 
 if __name__ == "__main__":
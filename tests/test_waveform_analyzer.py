@@ -24,7 +24,8 @@ import pytest
 
 from waveform_generator import (
     gen_sine_wf, gen_square_wf, gen_sawtooth_wf, gen_triangle_wf,
-    gen_wf, compute_max_env, compute_min_env, compute_rms_env,
+    gen_wf, gen_time_axis, compute_max_env, compute_min_env, compute_rms_env,
+    decimate_indices, interp_at,
 )
 from app_state import (
     AppState, WfState,
@@ -34,11 +35,14 @@ from app_state import (
 )
 from data_export import (
     export_to_csv, export_to_mat, export_to_json,
-    prep_wf_for_export, sanitize_fname,
+    prep_wf_for_export, sanitize_fname, CSV_CHUNK_ROWS,
 )
 from scipy.io import loadmat
 from config import load_config, save_config
-from ui_components import DARK_THEME, LIGHT_THEME
+from ui_components import (
+    DARK_THEME, LIGHT_THEME, PLOT_POINTS_PER_PIXEL, WaveformApp,
+    _apply_plot_style,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -523,6 +527,25 @@ class TestCSVExport:
         finally:
             os.unlink(path)
 
+    def test_export_rows_across_chunks(self) -> None:
+        """Rows written in several chunks match the sample data."""
+        dur = 2.5 * CSV_CHUNK_ROWS / 1000
+        t, y = gen_sine_wf(1.0, amp=2.0, offset=5.0, dur=dur)
+        wf = prep_wf_for_export("Long", t, y, "sine", 1.0, 2.0, 5.0, 50.0)
+        with tempfile.NamedTemporaryFile(
+            suffix=".csv", delete=False, mode="w"
+        ) as f:
+            path = f.name
+        try:
+            ok, _ = export_to_csv(path, [wf], dur=dur)
+            assert ok is True
+            data = np.loadtxt(path, delimiter=",", skiprows=4)
+            assert data.shape == (len(t), 2)
+            np.testing.assert_allclose(data[:, 0], t, atol=1e-6)
+            np.testing.assert_allclose(data[:, 1], y, atol=1e-6)
+        finally:
+            os.unlink(path)
+
     def test_sanitize_filename(self) -> None:
         """Filename sanitization removes invalid chars, adds extension."""
         assert sanitize_fname("test").endswith(".csv")
@@ -968,6 +991,20 @@ class TestColorCustomization:
         state.wfs[0].color = custom
         assert state.wfs[0].color == custom
 
+    def test_mpl_color_follows_color(self) -> None:
+        """The matplotlib 0-1 color is updated whenever color is set."""
+        state = AppState()
+        r, g, b = state.wfs[0].color
+        assert state.wfs[0].mpl_color == (r / 255, g / 255, b / 255)
+        state.wfs[0].color = (255, 0, 51)
+        assert state.wfs[0].mpl_color == (1.0, 0.0, 0.2)
+
+    def test_hex_color_follows_color(self) -> None:
+        """The hex color string is updated whenever color is set."""
+        state = AppState()
+        state.wfs[0].color = (255, 0, 51)
+        assert state.wfs[0].hex_color == "#ff0033"
+
     def test_color_preserved_on_remove(self) -> None:
         """Custom color survives removal of another waveform."""
         state = AppState()
@@ -1013,3 +1050,277 @@ class TestThemeToggle:
         """Config loads 'dark' as default theme."""
         cfg = load_config()
         assert cfg.get("theme") in ("dark", "light")
+
+    def test_theme_toggle_keeps_plot_rcparams(self) -> None:
+        """Switching plot styles keeps Agg path simplification off."""
+        from matplotlib import rcParams
+        _apply_plot_style(DARK_THEME["plt_style"])
+        _apply_plot_style(LIGHT_THEME["plt_style"])
+        assert rcParams["path.simplify"] is False
+        assert rcParams["agg.path.chunksize"] == 0
+        _apply_plot_style(DARK_THEME["plt_style"])
+        assert rcParams["path.simplify"] is False
+
+
+# ---------------------------------------------------------------------------
+# Shared application window
+# ---------------------------------------------------------------------------
+
+class TestGetApp:
+    """Verify get_app() reuses the window until it is destroyed."""
+
+    def test_destroyed_window_is_replaced(self, monkeypatch) -> None:
+        """get_app() builds a new window once the shared one is destroyed."""
+        import tkinter as tk
+        import main
+        import ui_components
+
+        class _FakeApp:
+            def __init__(self) -> None:
+                self.alive = True
+
+            def winfo_exists(self) -> int:
+                if not self.alive:
+                    raise tk.TclError("application has been destroyed")
+                return 1
+
+            def destroy(self) -> None:
+                self.alive = False
+
+        monkeypatch.setattr(ui_components, "WaveformApp", _FakeApp)
+        monkeypatch.setattr(main, "_app_instance", None)
+
+        first = main.get_app()
+        assert main.get_app() is first
+        first.destroy()
+        second = main.get_app()
+        assert second is not first
+        assert second.alive
+
+
+# ---------------------------------------------------------------------------
+# Closed-form generators match scipy.signal
+# ---------------------------------------------------------------------------
+
+class TestScipySignalParity:
+    """Verify the NumPy square/sawtooth/triangle match scipy.signal."""
+
+    @pytest.mark.parametrize("duty", [1.0, 25.0, 50.0, 73.0, 100.0])
+    def test_square_matches_scipy(self, duty: float) -> None:
+        """Square wave equals scipy.signal.square for the same duty."""
+        from scipy import signal
+        t, y = gen_square_wf(3.3, amp=4.0, duty_cycle=duty, offset=1.0, dur=2.0)
+        expected = 1.0 + 2.0 * signal.square(2 * np.pi * 3.3 * t, duty=duty / 100)
+        np.testing.assert_allclose(y, expected, atol=1e-12)
+
+    def test_sawtooth_matches_scipy(self) -> None:
+        """Sawtooth wave equals scipy.signal.sawtooth."""
+        from scipy import signal
+        t, y = gen_sawtooth_wf(7.1, amp=6.0, offset=2.0, dur=2.0)
+        expected = 2.0 + 3.0 * signal.sawtooth(2 * np.pi * 7.1 * t)
+        np.testing.assert_allclose(y, expected, atol=1e-12)
+
+    def test_triangle_matches_scipy(self) -> None:
+        """Triangle wave equals scipy.signal.sawtooth with width 0.5."""
+        from scipy import signal
+        t, y = gen_triangle_wf(0.7, amp=10.0, offset=5.0, dur=5.0)
+        expected = 5.0 + 5.0 * signal.sawtooth(2 * np.pi * 0.7 * t, width=0.5)
+        np.testing.assert_allclose(y, expected, atol=1e-12)
+
+
+# ---------------------------------------------------------------------------
+# Shared time axis
+# ---------------------------------------------------------------------------
+
+class TestSharedTimeAxis:
+    """Verify waveforms can share one precomputed time axis."""
+
+    def test_time_axis_matches_generated(self) -> None:
+        """gen_time_axis returns the same samples the generators build."""
+        t, _ = gen_sine_wf(1.0, amp=1.0, dur=2.5, sample_rate=400)
+        np.testing.assert_array_equal(gen_time_axis(2.5, 400), t)
+
+    @pytest.mark.parametrize("wf_type", ["sine", "square", "sawtooth", "triangle"])
+    def test_shared_time_axis_same_output(self, wf_type: str) -> None:
+        """Passing a precomputed axis gives identical samples and reuses it."""
+        shared = gen_time_axis(3.0, 1000)
+        t, y = gen_wf(wf_type, 2.0, 4.0, 1.0, 30.0, 3.0, 1000, time=shared)
+        _, expected = gen_wf(wf_type, 2.0, 4.0, 1.0, 30.0, 3.0, 1000)
+        assert t is shared
+        np.testing.assert_array_equal(y, expected)
+
+    @pytest.mark.parametrize("wf_type", ["sine", "square", "sawtooth", "triangle"])
+    def test_out_buffer_written_in_place(self, wf_type: str) -> None:
+        """Passing out= writes the samples into that buffer and returns it."""
+        shared = gen_time_axis(2.0, 500)
+        bufs = np.empty((2, len(shared)))
+        _, y = gen_wf(wf_type, 3.0, 2.0, 0.5, 40.0, 2.0, 500, time=shared, out=bufs[1])
+        _, expected = gen_wf(wf_type, 3.0, 2.0, 0.5, 40.0, 2.0, 500)
+        assert np.shares_memory(y, bufs[1])
+        np.testing.assert_allclose(bufs[1], expected, atol=1e-12)
+
+
+# ---------------------------------------------------------------------------
+# Plot decimation
+# ---------------------------------------------------------------------------
+
+class TestDecimation:
+    """Verify min/max decimation of traces for plotting."""
+
+    def test_short_trace_unchanged(self) -> None:
+        """Traces already within the point budget keep every sample."""
+        y = np.arange(50.0)
+        np.testing.assert_array_equal(decimate_indices(y, 100), np.arange(50))
+
+    def test_point_budget_respected(self) -> None:
+        """A long trace is reduced to about max_points samples."""
+        _, y = gen_sine_wf(37.0, amp=2.0, dur=120.0)
+        idx = decimate_indices(y, 2000)
+        assert len(idx) <= 2000 + 4
+        assert np.all(np.diff(idx) > 0)
+
+    def test_extremes_and_endpoints_kept(self) -> None:
+        """Global peaks and both endpoints survive decimation."""
+        _, y = gen_square_wf(13.0, amp=4.0, duty_cycle=3.0, offset=1.0, dur=60.0)
+        y = y.copy()
+        y[12345] = 9.0
+        idx = decimate_indices(y, 500)
+        assert idx[0] == 0 and idx[-1] == len(y) - 1
+        assert y[idx].max() == y.max()
+        assert y[idx].min() == y.min()
+
+    def test_plotted_points_follow_axes_width(self) -> None:
+        """Resizing the canvas re-decimates plotted traces to the new width."""
+        from matplotlib.figure import Figure
+
+        class _Plot:
+            _decimate = WaveformApp._decimate
+            _visible_range = WaveformApp._visible_range
+            _apply_decimated = WaveformApp._apply_decimated
+            _on_xlim_changed = WaveformApp._on_xlim_changed
+            _on_canvas_resize = WaveformApp._on_canvas_resize
+
+        plot = _Plot()
+        fig = Figure(figsize=(4, 3), dpi=100)
+        plot.ax = fig.add_subplot(111)
+        t, y = gen_sine_wf(37.0, amp=2.0, dur=120.0)
+        plot.ax.set_xlim(0, 120.0)
+        line = plot.ax.plot([], [])[0]
+        plot._line_sources = [([line], t, y)]
+        plot._p2p_source = None
+
+        plot._on_xlim_changed(plot.ax)
+        narrow = len(line.get_xdata())
+        fig.set_size_inches(12, 3)
+        plot._on_canvas_resize(None)
+        wide = len(line.get_xdata())
+
+        assert wide > narrow
+        assert wide <= PLOT_POINTS_PER_PIXEL * int(plot.ax.bbox.width) + 4
+
+
+# ---------------------------------------------------------------------------
+# State change notifications
+# ---------------------------------------------------------------------------
+
+class TestStateObservers:
+    """Verify AppState notifies subscribers of the changes they follow."""
+
+    def test_add_remove_notify_wfs(self) -> None:
+        """Adding and removing waveforms notifies the wfs topic."""
+        state = AppState()
+        calls = []
+        state.subscribe("wfs", lambda: calls.append("wfs"))
+        state.add_wf()
+        state.remove_wf(1)
+        assert calls == ["wfs", "wfs"]
+
+    def test_unsubscribe_stops_notifications(self) -> None:
+        """An unsubscribed callback is no longer called."""
+        state = AppState()
+        calls = []
+        callback = lambda: calls.append("wfs")
+        state.subscribe("wfs", callback)
+        state.add_wf()
+        state.unsubscribe("wfs", callback)
+        state.add_wf()
+        assert calls == ["wfs"]
+
+    def test_failed_remove_not_notified(self) -> None:
+        """Removing the last waveform changes nothing and notifies no one."""
+        state = AppState()
+        calls = []
+        state.subscribe("wfs", lambda: calls.append("wfs"))
+        assert state.remove_wf(0) is False
+        assert calls == []
+
+    def test_enable_notifies_only_on_change(self) -> None:
+        """set_wf_enabled notifies only when the flag actually flips."""
+        state = AppState()
+        calls = []
+        state.subscribe("wfs", lambda: calls.append("wfs"))
+        state.set_wf_enabled(0, True)
+        state.set_wf_enabled(0, False)
+        assert state.wfs[0].enabled is False
+        assert calls == ["wfs"]
+
+    def test_env_flags_notify_env(self) -> None:
+        """Envelope and hide-source flags notify the env topic on change."""
+        state = AppState()
+        env_calls, wfs_calls = [], []
+        state.subscribe("env", lambda: env_calls.append("env"))
+        state.subscribe("wfs", lambda: wfs_calls.append("wfs"))
+        state.show_max_env = True
+        state.show_max_env = True
+        state.hide_src_wfs = True
+        state.show_rms_env = False
+        assert env_calls == ["env", "env"]
+        assert wfs_calls == []
+
+
+# ---------------------------------------------------------------------------
+# Cursor readout interpolation
+# ---------------------------------------------------------------------------
+
+class TestInterpAt:
+    """Verify shared-axis interpolation matches np.interp."""
+
+    def test_matches_np_interp(self) -> None:
+        """Values inside, on and outside the time range match np.interp."""
+        t, y1 = gen_sine_wf(3.0, amp=2.0, offset=1.0, dur=2.0)
+        _, y2 = gen_square_wf(1.5, amp=4.0, duty_cycle=30.0, dur=2.0)
+        for x in (-0.5, 0.0, 0.12345, t[17], 1.0, t[-1], 3.0):
+            np.testing.assert_allclose(
+                interp_at(x, t, [y1, y2]),
+                [np.interp(x, t, y1), np.interp(x, t, y2)]
+            )
+
+    def test_no_arrays(self) -> None:
+        """An empty list of arrays gives an empty result."""
+        t = gen_time_axis(1.0)
+        assert interp_at(0.5, t, []) == []
+
+
+# ---------------------------------------------------------------------------
+# Config caching
+# ---------------------------------------------------------------------------
+
+class TestConfigCache:
+    """Verify load_config caches the file until it is saved."""
+
+    def test_returns_independent_copies(self) -> None:
+        """Modifying a loaded config does not affect later loads."""
+        cfg = load_config()
+        cfg["y_axis_title"] = "Changed"
+        assert load_config()["y_axis_title"] != "Changed"
+
+    def test_save_invalidates_cache(self, tmp_path, monkeypatch) -> None:
+        """A saved config is re-read on the next load."""
+        import config
+        path = str(tmp_path / "default.cfg")
+        monkeypatch.setattr(config, "_get_config_path", lambda: path)
+        assert load_config()["y_axis_title"] == "Amplitude"
+        cfg = load_config()
+        cfg["y_axis_title"] = "Voltage"
+        assert save_config(cfg)
+        assert load_config()["y_axis_title"] == "Voltage"
@@ -5,21 +5,25 @@ This module contains all CustomTkinter UI creation and callback logic.
 """
 
 import os
+import queue
 import sys
-from typing import Any, Optional, Tuple
+import threading
+from typing import TYPE_CHECKING, Any, Optional, Tuple
 import numpy as np
 import tkinter as tk
 import customtkinter as ctk
 from tkinter import filedialog, Menu, Toplevel, Label
 from tkinter.colorchooser import askcolor
 from CTkMenuBar import CTkMenuBar, CustomDropdownMenu
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.backends._backend_tk import NavigationToolbar2Tk
-from matplotlib.figure import Figure
+
+# Matplotlib is imported where the plot is built, not at module import
+if TYPE_CHECKING:
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    from matplotlib.backends._backend_tk import NavigationToolbar2Tk
+    from matplotlib.figure import Figure
 
 from app_state import (
-    app_state,
+    app_state, WfState,
     DEFAULT_DURATION, DEFAULT_FREQ, DEFAULT_AMP, DEFAULT_OFFSET, DEFAULT_DUTY_CYCLE,
     DURATION_MIN, DURATION_MAX, DURATION_STEP,
     FREQ_MIN, FREQ_MAX, FREQ_STEP,
@@ -28,9 +32,9 @@ from app_state import (
     DUTY_MIN, DUTY_MAX, DUTY_STEP
 )
 from config import load_config, save_config
-from waveform_generator import gen_wf, compute_max_env, compute_min_env, compute_rms_env
-from data_export import (
-    export_to_csv, export_to_mat, export_to_json, prep_wf_for_export
+from waveform_generator import (
+    gen_wf, gen_time_axis, compute_max_env, compute_min_env, compute_rms_env,
+    decimate_indices, interp_at
 )
 
 
@@ -138,6 +142,38 @@ GLOW_LINEWIDTHS = [8, 6, 4]
 GLOW_ALPHAS = [0.1, 0.2, 0.3]
 GLOW_CORE_WIDTH = 2
 
+# Plotted traces are decimated to about this many points per axes pixel
+PLOT_POINTS_PER_PIXEL = 2
+
+# Plot redraw coalescing (~60 Hz cap while parameters change rapidly)
+REDRAW_DELAY_MS = 16
+
+# Interval for checking on a background export
+EXPORT_POLL_MS = 50
+
+# Widget state option, indexed by whether the control is enabled
+CONTROL_STATES = ("disabled", "normal")
+
+# Envelope functions by kind, see _get_envelope
+ENV_FUNCS = {
+    "max": compute_max_env,
+    "min": compute_min_env,
+    "rms": compute_rms_env,
+}
+
+# Sidebar refreshes deferred by _request_update, in the order they run;
+# each name maps to an _update_<name> method
+DEFERRED_UPDATES = ("env_controls", "wf_list", "add_button")
+
+# Per-waveform numeric parameters: key -> (WfState attribute, min, max, step)
+# The key also names the widgets, e.g. freq_entry, freq_var, freq_dec_btn
+WF_PARAMS = {
+    "freq": ("freq", FREQ_MIN, FREQ_MAX, FREQ_STEP),
+    "amp": ("amp", AMP_MIN, AMP_MAX, AMP_STEP),
+    "offset": ("offset", OFFSET_MIN, OFFSET_MAX, OFFSET_STEP),
+    "duty": ("duty_cycle", DUTY_MIN, DUTY_MAX, DUTY_STEP),
+}
+
 # Cursor parameters
 CURSOR_PROXIMITY_THRESHOLD = 0.04  # 4% of visible Y range
 
@@ -150,10 +186,28 @@ ABOUT_DIALOG_SIZE = "400x310"
 PLOT_WINDOW_DEFAULT_SIZE = "800x600"
 
 
+def _apply_plot_style(style_name: str):
+    """Apply a matplotlib style and re-apply the plot's rcParams overrides.
+
+    style.use() resets every rcParam the style touches ("default" resets
+    all of them), so the overrides must follow each style change.
+
+    Args:
+        style_name: matplotlib style, e.g. a theme's "plt_style".
+    """
+    from matplotlib import rcParams, style
+
+    style.use(style_name)
+    # Traces are already decimated to the axes width, so Agg's own path
+    # simplification and chunking would only repeat that work per draw
+    rcParams["path.simplify"] = False
+    rcParams["agg.path.chunksize"] = 0
+
+
 class PlotWindow(ctk.CTkToplevel):
     """Separate window for detached plot display."""
 
-    def __init__(self, master: ctk.CTk, figure: Figure, on_close: Any):
+    def __init__(self, master: ctk.CTk, figure: "Figure", on_close: Any):
         """
         Initialize detached plot window.
 
@@ -162,6 +216,9 @@ class PlotWindow(ctk.CTkToplevel):
             figure: The matplotlib Figure to display.
             on_close: Callback function when window is closed.
         """
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.backends._backend_tk import NavigationToolbar2Tk
+
         super().__init__(master)
         self.title("Waveform Analyzer - Detached Plot")
         self.geometry(PLOT_WINDOW_DEFAULT_SIZE)
@@ -233,16 +290,42 @@ class WaveformApp(ctk.CTk):
         self._font_label = ctk.CTkFont(family=_FONT_FAMILY, size=12)
         self._font_caption = ctk.CTkFont(family=_FONT_FAMILY, size=12)
 
-        # Store widget references
+        # Store widget references (waveform list rows, indexed by waveform id)
+        self._wf_rows: list[ctk.CTkFrame] = []
         self.wf_buttons: list = []
         self.toggle_buttons: list = []
         self.remove_buttons: list = []
+        self._wf_list_key: Optional[tuple] = None  # State shown by the rows
         self._tooltip: Optional[Any] = None
         self._section_labels: dict[ctk.CTkFrame, ctk.CTkLabel] = {}
 
         # Cached waveform data for cursor proximity checks
         self._cached_wf_data: list[Tuple[np.ndarray, np.ndarray]] = []
 
+        # Time axis shared by all waveforms, keyed by (duration, sample rate),
+        # and the (MAX_WFS, samples) buffer waveforms are generated into
+        self._time_axis: Optional[np.ndarray] = None
+        self._time_axis_key: Optional[Tuple[float, int]] = None
+        self._amp_bufs: Optional[np.ndarray] = None
+
+        # Generated samples per waveform id: id -> (params key, (time, amp))
+        self._wf_cache: dict[int, Tuple[tuple, Tuple[np.ndarray, np.ndarray]]] = {}
+
+        # Envelopes of _cached_wf_data by kind, valid while the params keys
+        # of the enabled waveforms equal _env_cache_key
+        self._env_cache: dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._env_cache_key: Optional[tuple] = None
+
+        # Results of background exports, see _run_export
+        self._export_results: "queue.Queue[Tuple[bool, str]]" = queue.Queue()
+
+        # Pending coalesced redraw (Tk after id), see _schedule_redraw
+        self._redraw_after_id: Optional[str] = None
+
+        # Pending sidebar refreshes (Tk after id), see _request_update
+        self._pending_updates: set[str] = set()
+        self._updates_after_id: Optional[str] = None
+
         # Detached plot window state
         self.plot_window: Optional[PlotWindow] = None
         self.is_detached: bool = False
@@ -262,16 +345,38 @@ class WaveformApp(ctk.CTk):
         self._create_plot_area()
         self._create_status_bar()
 
-        # Connect cursor events (always on)
-        self.canvas.mpl_connect('motion_notify_event', self._on_mouse_move)
-        self.canvas.mpl_connect('button_press_event', self._on_plot_click)
+        # Refresh the sidebar when the state it shows changes; the
+        # callbacks are dropped again in destroy()
+        self._state_subscriptions = [
+            ("wfs", lambda: self._request_update(
+                "env_controls", "wf_list", "add_button"
+            )),
+            ("env", lambda: self._request_update("wf_list", "add_button")),
+        ]
+        for topic, callback in self._state_subscriptions:
+            app_state.subscribe(topic, callback)
 
         # Initialize UI state
         self._update_wf_list()
         self._update_wf_parameters()
         self._update_env_controls()
         self._update_add_button()
-        self._update_all_plots()
+
+        # Show the window first; matplotlib is loaded and the figure built
+        # once the event loop runs
+        self.update_idletasks()
+        self.after(0, self._init_plot)
+
+    def destroy(self):
+        """Drop the app_state callbacks and destroy the window.
+
+        app_state outlives the window, so callbacks left registered would
+        keep it alive and schedule work on a destroyed Tk root.
+        """
+        for topic, callback in getattr(self, "_state_subscriptions", ()):
+            app_state.unsubscribe(topic, callback)
+        self._state_subscriptions = []
+        super().destroy()
 
     @staticmethod
     def _get_icon_path() -> str:
@@ -359,10 +464,13 @@ class WaveformApp(ctk.CTk):
         cfg["theme"] = _theme["ctk_mode"]
         save_config(cfg)
 
-        # Update matplotlib style and plot colors
-        plt.style.use(_theme["plt_style"])
-        self.fig.set_facecolor(_theme["plot_bg"])
-        self.ax.set_facecolor(_theme["plot_bg"])
+        # Update matplotlib style and plot colors; clearing the axes
+        # re-applies the new style to ticks, spines and labels
+        _apply_plot_style(_theme["plt_style"])
+        if self.fig is not None:
+            self.fig.set_facecolor(_theme["plot_bg"])
+            self.ax.set_facecolor(_theme["plot_bg"])
+            self._reset_axes()
 
         # Rebuild menu bar (CTkMenuBar colors are set in constructor)
         self.menu_bar.destroy()
@@ -381,11 +489,13 @@ class WaveformApp(ctk.CTk):
             )
             label.configure(text_color=_theme["section_header"])
 
-        # Refresh all UI
+        # Refresh all UI (list rows are rebuilt with the new theme colors)
+        self._destroy_wf_rows(0)
         self._update_wf_list()
         self._update_env_controls()
         self._update_add_button()
-        self._update_all_plots()
+        if self.ax is not None:
+            self._update_all_plots()
 
     def _toggle_plot_detachment(self):
         """Toggle between attached and detached plot modes."""
@@ -531,7 +641,7 @@ class WaveformApp(ctk.CTk):
                 self._plot_y_min = new_y_min
                 self._plot_y_max = new_y_max
                 self._plot_y_title = new_settings["y_axis_title"]
-                self._update_all_plots()
+                self._schedule_redraw()
                 status_lbl.configure(
                     text="Saved. Waveform settings apply on next launch.",
                     text_color=_theme["success"]
@@ -677,7 +787,7 @@ class WaveformApp(ctk.CTk):
         self.wf_type_combo.set("Sine")
 
         # Wave Duration
-        _, self.duration_frame, self.duration_entry, \
+        _, self.duration_frame, self.duration_entry, self.duration_var, \
             self.duration_dec_btn, self.duration_inc_btn = \
             self._create_param_row(
                 "Wave Duration (s)", DEFAULT_DURATION,
@@ -687,42 +797,46 @@ class WaveformApp(ctk.CTk):
             )
 
         # Offset
-        _, self.offset_frame, self.offset_entry, \
+        _, self.offset_frame, self.offset_entry, self.offset_var, \
             self.offset_dec_btn, self.offset_inc_btn = \
             self._create_param_row(
                 "Offset", DEFAULT_OFFSET,
-                self._on_offset_enter,
-                self._on_offset_dec, self._on_offset_inc,
+                lambda e=None: self._on_param_enter("offset"),
+                lambda: self._on_param_step("offset", -1),
+                lambda: self._on_param_step("offset", 1),
                 parent=self._params_card
             )
 
         # Frequency
-        _, self.freq_frame, self.freq_entry, \
+        _, self.freq_frame, self.freq_entry, self.freq_var, \
             self.freq_dec_btn, self.freq_inc_btn = \
             self._create_param_row(
                 "Frequency (Hz)", DEFAULT_FREQ,
-                self._on_freq_enter,
-                self._on_freq_dec, self._on_freq_inc,
+                lambda e=None: self._on_param_enter("freq"),
+                lambda: self._on_param_step("freq", -1),
+                lambda: self._on_param_step("freq", 1),
                 parent=self._params_card
             )
 
         # Amplitude
-        _, self.amp_frame, self.amp_entry, \
+        _, self.amp_frame, self.amp_entry, self.amp_var, \
             self.amp_dec_btn, self.amp_inc_btn = \
             self._create_param_row(
                 "Amplitude", DEFAULT_AMP,
-                self._on_amp_enter,
-                self._on_amp_dec, self._on_amp_inc,
+                lambda e=None: self._on_param_enter("amp"),
+                lambda: self._on_param_step("amp", -1),
+                lambda: self._on_param_step("amp", 1),
                 parent=self._params_card
             )
 
         # Duty Cycle (hidden by default, shown for Square waves)
-        self.duty_label, self.duty_frame, self.duty_entry, \
+        self.duty_label, self.duty_frame, self.duty_entry, self.duty_var, \
             self.duty_dec_btn, self.duty_inc_btn = \
             self._create_param_row(
                 "Duty Cycle (%)", DEFAULT_DUTY_CYCLE,
-                self._on_duty_enter,
-                self._on_duty_dec, self._on_duty_inc,
+                lambda e=None: self._on_param_enter("duty"),
+                lambda: self._on_param_step("duty", -1),
+                lambda: self._on_param_step("duty", 1),
                 parent=self._params_card,
                 pack=False
             )
@@ -787,27 +901,41 @@ class WaveformApp(ctk.CTk):
         )
         self.show_rms_env_label.pack(side="left")
 
+        # (checkbox, label, variable, AppState flag) of each envelope
+        self._env_rows = [
+            (self.show_max_env_cb, self.show_max_env_label,
+             self.show_max_env_var, "show_max_env"),
+            (self.show_min_env_cb, self.show_min_env_label,
+             self.show_min_env_var, "show_min_env"),
+            (self.show_rms_env_cb, self.show_rms_env_label,
+             self.show_rms_env_var, "show_rms_env"),
+        ]
+
         # Live cursor state: tracks mouse, click pins a reference
         self._live_cursor_x: Optional[float] = None
+        self._last_mouse_px: Optional[Tuple[float, float]] = None
         self._live_cursor_vline: Optional[Any] = None
         self._pinned_cursor_x: Optional[float] = None
         self._pinned_cursor_vline: Optional[Any] = None
         self._highlight_marker: Optional[Any] = None
         self._highlighted_wf_name: Optional[str] = None
         self._pinned_annotation: Optional[Any] = None
+        # Plot image without the live cursor artists, see _blit_cursor
+        self._cursor_bg: Optional[Any] = None
         self._live_annotation: Optional[Any] = None
 
         # === Export Card ===
         export_card = self._create_section_card("Export")
 
-        ctk.CTkButton(
+        self.export_btn = ctk.CTkButton(
             export_card, text="Export Waveform Data",
             command=self._on_export_clicked,
             corner_radius=RADIUS_FULL,
             fg_color=_theme["btn_primary"],
             text_color=_theme["btn_primary_text"],
             font=self._font_body
-        ).pack(fill="x", padx=SP_MD, pady=(0, SP_SM))
+        )
+        self.export_btn.pack(fill="x", padx=SP_MD, pady=(0, SP_SM))
 
         self.export_status = ctk.CTkLabel(
             export_card, text="Status: Ready",
@@ -818,7 +946,7 @@ class WaveformApp(ctk.CTk):
             anchor="w", padx=SP_MD, pady=(0, SP_MD)
         )
 
-    def _create_embedded_plot_widgets(self, parent_frame: ctk.CTkFrame) -> Tuple[FigureCanvasTkAgg, NavigationToolbar2Tk]:
+    def _create_embedded_plot_widgets(self, parent_frame: ctk.CTkFrame) -> Tuple["FigureCanvasTkAgg", "NavigationToolbar2Tk"]:
         """
         Create matplotlib canvas and toolbar widgets for embedding.
 
@@ -828,6 +956,9 @@ class WaveformApp(ctk.CTk):
         Returns:
             Tuple of (canvas, toolbar).
         """
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.backends._backend_tk import NavigationToolbar2Tk
+
         # Create matplotlib canvas
         canvas = FigureCanvasTkAgg(self.fig, master=parent_frame)
         canvas.get_tk_widget().grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
@@ -841,7 +972,7 @@ class WaveformApp(ctk.CTk):
         return canvas, toolbar
 
     def _create_plot_area(self):
-        """Create the matplotlib plot area."""
+        """Create the plot area with a placeholder until _init_plot runs."""
         # Plot container
         self.plot_frame = ctk.CTkFrame(
             self.content_frame, corner_radius=RADIUS_MEDIUM
@@ -853,20 +984,50 @@ class WaveformApp(ctk.CTk):
         self.plot_frame.grid_columnconfigure(0, weight=1)
         self.plot_frame.grid_rowconfigure(0, weight=1)
 
+        # Figure, axes and canvas are created by _init_plot
+        self.fig: Optional["Figure"] = None
+        self.ax: Optional[Any] = None
+        self._plot_placeholder = ctk.CTkLabel(
+            self.plot_frame, text="Loading plot...",
+            font=self._font_body, text_color=_theme["text_disabled"]
+        )
+        self._plot_placeholder.grid(row=0, column=0)
+
+    def _init_plot(self):
+        """Create the matplotlib figure and canvas in the plot area.
+
+        Deferred from __init__ so the window is shown before matplotlib
+        is imported and the first figure is drawn.
+        """
+        from matplotlib.figure import Figure
+
+        self._plot_placeholder.destroy()
+
         # Create matplotlib figure with dark theme
-        plt.style.use(_theme["plt_style"])
+        _apply_plot_style(_theme["plt_style"])
         self.fig = Figure(figsize=(8, 6), facecolor=_theme["plot_bg"])
         self.ax = self.fig.add_subplot(111)
         self.ax.set_facecolor(_theme["plot_bg"])
 
-        # Configure axes
-        self.ax.set_xlabel("Time (s)")
+        # Configure axes and create the plot artists
+        self._reset_axes()
         self.ax.set_ylabel(self._plot_y_title)
-        self.ax.grid(True, alpha=0.3, color=_theme["separator"])
 
         # Embed canvas and toolbar
         self.canvas, self.toolbar = self._create_embedded_plot_widgets(self.plot_frame)
 
+        self._connect_canvas_events()
+
+        self._update_all_plots()
+
+    def _connect_canvas_events(self):
+        """Connect the cursor and blitting handlers to the current canvas."""
+        self._cursor_bg = None
+        self.canvas.mpl_connect('motion_notify_event', self._on_mouse_move)
+        self.canvas.mpl_connect('button_press_event', self._on_plot_click)
+        self.canvas.mpl_connect('draw_event', self._on_canvas_draw)
+        self.canvas.mpl_connect('resize_event', self._on_canvas_resize)
+
     def _create_status_bar(self):
         """Create the status bar."""
         self.status_bar = ctk.CTkLabel(
@@ -880,8 +1041,8 @@ class WaveformApp(ctk.CTk):
 
     def _detach_plot(self):
         """Move plot from main window to separate detached window."""
-        if self.is_detached:
-            return  # Already detached
+        if self.is_detached or self.fig is None:
+            return  # Already detached, or the plot is not built yet
 
         self.is_detached = True
 
@@ -938,12 +1099,10 @@ class WaveformApp(ctk.CTk):
         self.canvas = self.plot_window.canvas
         self.toolbar = self.plot_window.toolbar
 
-        # Reconnect matplotlib events
-        self.canvas.mpl_connect('motion_notify_event', self._on_mouse_move)
-        self.canvas.mpl_connect('button_press_event', self._on_plot_click)
+        self._connect_canvas_events()
 
-        # Redraw in detached window
-        self.canvas.draw()
+        # Redraw in detached window once Tk is idle
+        self.canvas.draw_idle()
 
     def _attach_plot(self):
         """Return plot from detached window to main window."""
@@ -964,12 +1123,10 @@ class WaveformApp(ctk.CTk):
         # Recreate embedded canvas and toolbar in main window
         self.canvas, self.toolbar = self._create_embedded_plot_widgets(self.plot_frame)
 
-        # Reconnect matplotlib events
-        self.canvas.mpl_connect('motion_notify_event', self._on_mouse_move)
-        self.canvas.mpl_connect('button_press_event', self._on_plot_click)
+        self._connect_canvas_events()
 
-        # Redraw in main window
-        self.canvas.draw()
+        # Redraw in main window once Tk is idle
+        self.canvas.draw_idle()
 
     def _create_section_card(self, title: str) -> ctk.CTkFrame:
         """Create a WinUI-style card with a title header.
@@ -1008,7 +1165,10 @@ class WaveformApp(ctk.CTk):
         on_inc: Any,
         parent: Optional[ctk.CTkFrame] = None,
         pack: bool = True
-    ) -> Tuple[ctk.CTkLabel, ctk.CTkFrame, ctk.CTkEntry, ctk.CTkButton, ctk.CTkButton]:
+    ) -> Tuple[
+        ctk.CTkLabel, ctk.CTkFrame, ctk.CTkEntry, ctk.StringVar,
+        ctk.CTkButton, ctk.CTkButton
+    ]:
         """Create a parameter input row with label, entry, and +/- buttons.
 
         Args:
@@ -1021,7 +1181,7 @@ class WaveformApp(ctk.CTk):
             pack: Whether to pack the label and frame immediately.
 
         Returns:
-            Tuple of (label, frame, entry, dec_btn, inc_btn).
+            Tuple of (label, frame, entry, entry_var, dec_btn, inc_btn).
         """
         container = parent or self.sidebar
         label = ctk.CTkLabel(
@@ -1029,12 +1189,13 @@ class WaveformApp(ctk.CTk):
         )
         frame = ctk.CTkFrame(container, fg_color="transparent")
 
+        # The entry text is set through its variable in one Tk call
+        var = ctk.StringVar(value=f"{default_val:.1f}")
         entry = ctk.CTkEntry(
-            frame, width=120,
+            frame, width=120, textvariable=var,
             corner_radius=RADIUS_SMALL, font=self._font_body
         )
         entry.pack(side="left", padx=(0, SP_XS))
-        entry.insert(0, f"{default_val:.1f}")
         entry.bind("<Return>", on_enter)
         entry.bind("<FocusOut>", on_enter)
 
@@ -1062,7 +1223,27 @@ class WaveformApp(ctk.CTk):
             label.pack(anchor="w", padx=SP_MD, pady=(SP_XS, SP_XS))
             frame.pack(fill="x", padx=SP_MD, pady=(0, SP_SM))
 
-        return label, frame, entry, dec_btn, inc_btn
+        return label, frame, entry, var, dec_btn, inc_btn
+
+    @staticmethod
+    def _set_entry_text(var: ctk.StringVar, text: str):
+        """Set an entry variable's text, skipping the Tk call if unchanged."""
+        if var.get() != text:
+            var.set(text)
+
+    @staticmethod
+    def _configure_if_changed(widget: Any, **kwargs: Any):
+        """Configure only the options that differ from the widget's values.
+
+        CTk widgets redraw on every configure() call, even for an unchanged
+        value, while cget() just reads the stored option.
+        """
+        changed = {
+            name: value for name, value in kwargs.items()
+            if widget.cget(name) != value
+        }
+        if changed:
+            widget.configure(**changed)
 
     # === Callback Methods ===
 
@@ -1096,8 +1277,8 @@ class WaveformApp(ctk.CTk):
             check_name = new_name if new_name else f"Waveform {wf.id + 1}"
             if not self._is_duplicate_name(check_name, wf_id):
                 wf.name = new_name
-                self._update_wf_list()
-                self._update_all_plots()
+                self._request_update("wf_list")
+                self._schedule_redraw()
                 return
 
             prompt = f'"{check_name}" is already in use.\nEnter a different name:'
@@ -1108,9 +1289,8 @@ class WaveformApp(ctk.CTk):
         if not wf:
             return
 
-        initial_hex = '#{:02x}{:02x}{:02x}'.format(*wf.color)
         result = askcolor(
-            color=initial_hex,
+            color=wf.hex_color,
             title=f"Choose Color for {wf.display_name}"
         )
 
@@ -1119,8 +1299,8 @@ class WaveformApp(ctk.CTk):
 
         rgb = result[0]
         wf.color = (int(rgb[0]), int(rgb[1]), int(rgb[2]))
-        self._update_wf_list()
-        self._update_all_plots()
+        self._request_update("wf_list")
+        self._schedule_redraw()
 
     def _show_wf_context_menu(self, event: tk.Event, wf_id: int):
         """Show right-click context menu for a waveform button."""
@@ -1170,34 +1350,36 @@ class WaveformApp(ctk.CTk):
     def _on_duration_enter(self, event: Optional[tk.Event] = None):
         """Handle duration entry."""
         try:
-            value = float(self.duration_entry.get())
+            value = float(self.duration_var.get())
             value = max(DURATION_MIN, min(DURATION_MAX, value))
+            self._set_entry_text(self.duration_var, f"{value:.1f}")
+            if value == app_state.duration:
+                return  # Unchanged, e.g. focus left an unedited entry
             app_state.set_duration(value)
-            self.duration_entry.delete(0, "end")
-            self.duration_entry.insert(0, f"{value:.1f}")
             self._update_duration_btns()
-            self._update_all_plots()
+            self._schedule_redraw()
         except ValueError:
-            self.duration_entry.delete(0, "end")
-            self.duration_entry.insert(0, f"{app_state.duration:.1f}")
+            self._set_entry_text(self.duration_var, f"{app_state.duration:.1f}")
 
     def _on_duration_inc(self):
         """Increment duration."""
         new_value = min(DURATION_MAX, app_state.duration + DURATION_STEP)
+        if new_value == app_state.duration:
+            return
         app_state.set_duration(new_value)
-        self.duration_entry.delete(0, "end")
-        self.duration_entry.insert(0, f"{new_value:.1f}")
+        self._set_entry_text(self.duration_var, f"{new_value:.1f}")
         self._update_duration_btns()
-        self._update_all_plots()
+        self._schedule_redraw()
 
     def _on_duration_dec(self):
         """Decrement duration."""
         new_value = max(DURATION_MIN, app_state.duration - DURATION_STEP)
+        if new_value == app_state.duration:
+            return
         app_state.set_duration(new_value)
-        self.duration_entry.delete(0, "end")
-        self.duration_entry.insert(0, f"{new_value:.1f}")
+        self._set_entry_text(self.duration_var, f"{new_value:.1f}")
         self._update_duration_btns()
-        self._update_all_plots()
+        self._schedule_redraw()
 
     def _on_env_changed(self, attr: str, var: ctk.BooleanVar):
         """Handle any envelope toggle.
@@ -1208,8 +1390,7 @@ class WaveformApp(ctk.CTk):
         """
         setattr(app_state, attr, var.get())
         self._auto_hide_source_waveforms()
-        self._update_env_controls()
-        self._update_all_plots()
+        self._schedule_redraw()
 
     def _auto_hide_source_waveforms(self):
         """Automatically hide/show source waveforms based on envelope state."""
@@ -1219,41 +1400,36 @@ class WaveformApp(ctk.CTk):
             or app_state.show_rms_env
         )
         app_state.hide_src_wfs = any_envelope_shown
-        self._update_wf_management_controls()
 
     def _on_add_wf(self):
         """Add a new waveform."""
         new_wf = app_state.add_wf()
         if new_wf:
-            self._update_wf_list()
             self._update_wf_parameters()
-            self._update_env_controls()
-            self._update_all_plots()
-            self._update_add_button()
+            self._schedule_redraw()
 
     def _on_remove_wf(self, wf_id: int):
         """Remove a waveform."""
         if app_state.remove_wf(wf_id):
-            self._update_wf_list()
+            # Waveforms after the removed one are renumbered, so their
+            # cached samples no longer match their ids
+            for cached_id in [i for i in self._wf_cache if i >= wf_id]:
+                del self._wf_cache[cached_id]
             self._update_wf_parameters()
-            self._update_env_controls()
-            self._update_all_plots()
-            self._update_add_button()
+            self._schedule_redraw()
 
     def _on_toggle_wf(self, wf_id: int):
         """Toggle waveform visibility."""
         wf = app_state.get_wf(wf_id)
         if wf:
-            wf.enabled = not wf.enabled
-            self._update_env_controls()
-            self._update_all_plots()
-            self._update_wf_list()
+            app_state.set_wf_enabled(wf_id, not wf.enabled)
+            self._schedule_redraw()
 
     def _on_select_wf(self, wf_id: int):
         """Select a waveform for editing."""
         app_state.active_wf_index = wf_id
         self._update_wf_parameters()
-        self._update_wf_list()
+        self._request_update("wf_list")
 
     def _on_wf_type_changed(self, value: str):
         """Handle waveform type change."""
@@ -1261,159 +1437,48 @@ class WaveformApp(ctk.CTk):
         if wf:
             wf.wf_type = value.lower()
             self._update_wf_parameters()
-            self._update_all_plots()
-
-    def _on_freq_enter(self, event: Optional[tk.Event] = None):
-        """Handle frequency entry."""
-        wf = app_state.get_active_wf()
-        if wf:
-            try:
-                value = float(self.freq_entry.get())
-                value = max(FREQ_MIN, min(FREQ_MAX, value))
-                wf.freq = value
-                self.freq_entry.delete(0, "end")
-                self.freq_entry.insert(0, f"{value:.1f}")
-                self._update_freq_btns()
-                self._update_all_plots()
-            except ValueError:
-                self.freq_entry.delete(0, "end")
-                self.freq_entry.insert(0, f"{wf.freq:.1f}")
-
-    def _on_freq_inc(self):
-        """Increment frequency."""
-        wf = app_state.get_active_wf()
-        if wf:
-            new_value = min(FREQ_MAX, wf.freq + FREQ_STEP)
-            wf.freq = new_value
-            self.freq_entry.delete(0, "end")
-            self.freq_entry.insert(0, f"{new_value:.1f}")
-            self._update_freq_btns()
-            self._update_all_plots()
-
-    def _on_freq_dec(self):
-        """Decrement frequency."""
-        wf = app_state.get_active_wf()
-        if wf:
-            new_value = max(FREQ_MIN, wf.freq - FREQ_STEP)
-            wf.freq = new_value
-            self.freq_entry.delete(0, "end")
-            self.freq_entry.insert(0, f"{new_value:.1f}")
-            self._update_freq_btns()
-            self._update_all_plots()
-
-    def _on_amp_enter(self, event: Optional[tk.Event] = None):
-        """Handle amplitude entry."""
-        wf = app_state.get_active_wf()
-        if wf:
-            try:
-                value = float(self.amp_entry.get())
-                value = max(AMP_MIN, min(AMP_MAX, value))
-                wf.amp = value
-                self.amp_entry.delete(0, "end")
-                self.amp_entry.insert(0, f"{value:.1f}")
-                self._update_amp_btns()
-                self._update_all_plots()
-            except ValueError:
-                self.amp_entry.delete(0, "end")
-                self.amp_entry.insert(0, f"{wf.amp:.1f}")
-
-    def _on_amp_inc(self):
-        """Increment amplitude."""
-        wf = app_state.get_active_wf()
-        if wf:
-            new_value = min(AMP_MAX, wf.amp + AMP_STEP)
-            wf.amp = new_value
-            self.amp_entry.delete(0, "end")
-            self.amp_entry.insert(0, f"{new_value:.1f}")
-            self._update_amp_btns()
-            self._update_all_plots()
-
-    def _on_amp_dec(self):
-        """Decrement amplitude."""
-        wf = app_state.get_active_wf()
-        if wf:
-            new_value = max(AMP_MIN, wf.amp - AMP_STEP)
-            wf.amp = new_value
-            self.amp_entry.delete(0, "end")
-            self.amp_entry.insert(0, f"{new_value:.1f}")
-            self._update_amp_btns()
-            self._update_all_plots()
-
-    def _on_offset_enter(self, event: Optional[tk.Event] = None):
-        """Handle offset entry."""
-        wf = app_state.get_active_wf()
-        if wf:
-            try:
-                value = float(self.offset_entry.get())
-                value = max(OFFSET_MIN, min(OFFSET_MAX, value))
-                wf.offset = value
-                self.offset_entry.delete(0, "end")
-                self.offset_entry.insert(0, f"{value:.1f}")
-                self._update_offset_btns()
-                self._update_all_plots()
-            except ValueError:
-                self.offset_entry.delete(0, "end")
-                self.offset_entry.insert(0, f"{wf.offset:.1f}")
+            self._schedule_redraw()
 
-    def _on_offset_inc(self):
-        """Increment offset."""
-        wf = app_state.get_active_wf()
-        if wf:
-            new_value = min(OFFSET_MAX, wf.offset + OFFSET_STEP)
-            wf.offset = new_value
-            self.offset_entry.delete(0, "end")
-            self.offset_entry.insert(0, f"{new_value:.1f}")
-            self._update_offset_btns()
-            self._update_all_plots()
+    def _on_param_enter(self, key: str):
+        """Handle entry of a waveform parameter.
 
-    def _on_offset_dec(self):
-        """Decrement offset."""
-        wf = app_state.get_active_wf()
-        if wf:
-            new_value = max(OFFSET_MIN, wf.offset - OFFSET_STEP)
-            wf.offset = new_value
-            self.offset_entry.delete(0, "end")
-            self.offset_entry.insert(0, f"{new_value:.1f}")
-            self._update_offset_btns()
-            self._update_all_plots()
-
-    def _on_duty_enter(self, event: Optional[tk.Event] = None):
-        """Handle duty cycle entry."""
+        Args:
+            key: WF_PARAMS key of the parameter.
+        """
         wf = app_state.get_active_wf()
         if wf:
+            attr, min_val, max_val, _ = WF_PARAMS[key]
+            var = getattr(self, f"{key}_var")
             try:
-                value = float(self.duty_entry.get())
-                value = max(DUTY_MIN, min(DUTY_MAX, value))
-                wf.duty_cycle = value
-                self.duty_entry.delete(0, "end")
-                self.duty_entry.insert(0, f"{value:.1f}")
-                self._update_duty_btns()
-                self._update_all_plots()
+                value = float(var.get())
+                value = max(min_val, min(max_val, value))
+                self._set_entry_text(var, f"{value:.1f}")
+                if value == getattr(wf, attr):
+                    return  # Unchanged, e.g. focus left an unedited entry
+                setattr(wf, attr, value)
+                self._update_param_btns(key, wf)
+                self._schedule_redraw()
             except ValueError:
-                self.duty_entry.delete(0, "end")
-                self.duty_entry.insert(0, f"{wf.duty_cycle:.1f}")
+                self._set_entry_text(var, f"{getattr(wf, attr):.1f}")
 
-    def _on_duty_inc(self):
-        """Increment duty cycle."""
-        wf = app_state.get_active_wf()
-        if wf:
-            new_value = min(DUTY_MAX, wf.duty_cycle + DUTY_STEP)
-            wf.duty_cycle = new_value
-            self.duty_entry.delete(0, "end")
-            self.duty_entry.insert(0, f"{new_value:.1f}")
-            self._update_duty_btns()
-            self._update_all_plots()
+    def _on_param_step(self, key: str, direction: int):
+        """Step a waveform parameter up or down, clamped to its range.
 
-    def _on_duty_dec(self):
-        """Decrement duty cycle."""
+        Args:
+            key: WF_PARAMS key of the parameter.
+            direction: 1 to increment, -1 to decrement.
+        """
         wf = app_state.get_active_wf()
         if wf:
-            new_value = max(DUTY_MIN, wf.duty_cycle - DUTY_STEP)
-            wf.duty_cycle = new_value
-            self.duty_entry.delete(0, "end")
-            self.duty_entry.insert(0, f"{new_value:.1f}")
-            self._update_duty_btns()
-            self._update_all_plots()
+            attr, min_val, max_val, step = WF_PARAMS[key]
+            value = getattr(wf, attr)
+            new_value = max(min_val, min(max_val, value + direction * step))
+            if new_value == value:
+                return
+            setattr(wf, attr, new_value)
+            self._set_entry_text(getattr(self, f"{key}_var"), f"{new_value:.1f}")
+            self._update_param_btns(key, wf)
+            self._schedule_redraw()
 
     def _on_export_clicked(self):
         """Handle export button click - shows native file dialog."""
@@ -1431,19 +1496,18 @@ class WaveformApp(ctk.CTk):
         if not filename:
             return  # User cancelled
 
-        # Collect enabled waveform data
+        # Imported on first export so startup does not load the exporters
+        from data_export import (
+            export_to_csv, export_to_mat, export_to_json, prep_wf_for_export
+        )
+
+        # Collect enabled waveform data. Samples are copied here because
+        # redraws regenerate them in place while the export runs.
         wfs_to_export = []
         wf_arrays = []
         for wf in app_state.get_enabled_wfs():
-            time, amp = gen_wf(
-                wf.wf_type,
-                wf.freq,
-                wf.amp,
-                wf.offset,
-                wf.duty_cycle,
-                app_state.duration,
-                app_state.sample_rate
-            )
+            time, amp = self._get_wf_samples(wf)
+            amp = amp.copy()
             wf_arrays.append((time, amp))
 
             name = wf.display_name.replace(" ", "_")
@@ -1457,22 +1521,13 @@ class WaveformApp(ctk.CTk):
             )
             wfs_to_export.append(export_data)
 
-        # Collect envelope data if enabled
-        envs_to_export = []
-        if app_state.can_show_envelopes() and wf_arrays:
-            if app_state.show_max_env:
-                time, max_env = compute_max_env(wf_arrays)
-                envs_to_export.append(("Max_Envelope", time, max_env))
-
-            if app_state.show_min_env:
-                time, min_env = compute_min_env(wf_arrays)
-                envs_to_export.append(("Min_Envelope", time, min_env))
-
-            if app_state.show_rms_env:
-                time, rms_env = compute_rms_env(wf_arrays)
-                envs_to_export.append(("RMS_Envelope", time, rms_env))
-
-        envs_arg = envs_to_export if envs_to_export else None
+        # Envelopes to export, if enabled
+        can_show = app_state.can_show_envelopes()
+        env_flags = (
+            can_show and app_state.show_max_env,
+            can_show and app_state.show_min_env,
+            can_show and app_state.show_rms_env,
+        )
 
         # Select export function based on file extension
         ext = os.path.splitext(filename)[1].lower()
@@ -1483,15 +1538,82 @@ class WaveformApp(ctk.CTk):
         else:
             export_fn = export_to_csv
 
-        success, message = export_fn(
-            filename,
-            wfs_to_export,
-            envs_arg,
-            app_state.sample_rate,
-            app_state.duration
+        # Compute envelopes and write the file on a worker thread
+        self.export_btn.configure(state="disabled")
+        self.export_status.configure(
+            text="Status: Exporting...", text_color=_theme["text"]
         )
+        threading.Thread(
+            target=self._run_export,
+            args=(
+                export_fn, filename, wfs_to_export, wf_arrays, env_flags,
+                app_state.sample_rate, app_state.duration
+            ),
+            daemon=True
+        ).start()
+        self.after(EXPORT_POLL_MS, self._poll_export)
+
+    def _run_export(
+        self,
+        export_fn: Any,
+        filename: str,
+        wfs_to_export: list,
+        wf_arrays: list,
+        env_flags: Tuple[bool, bool, bool],
+        sample_rate: int,
+        duration: float
+    ):
+        """Compute envelopes and write the export file (worker thread).
+
+        Must not touch Tk widgets or app_state; the result is handed back
+        through _export_results and applied by _poll_export.
+
+        Args:
+            export_fn: One of export_to_csv, export_to_mat, export_to_json.
+            filename: Destination filename.
+            wfs_to_export: Waveforms from prep_wf_for_export.
+            wf_arrays: (time, amplitude) tuples of the exported waveforms.
+            env_flags: Whether to export the (max, min, RMS) envelopes.
+            sample_rate: Sample rate in samples/second.
+            duration: Duration in seconds.
+        """
+        result = (False, "Export failed.")
+        try:
+            envs_to_export = []
+            if wf_arrays:
+                show_max, show_min, show_rms = env_flags
+                if show_max:
+                    time, max_env = compute_max_env(wf_arrays)
+                    envs_to_export.append(("Max_Envelope", time, max_env))
+
+                if show_min:
+                    time, min_env = compute_min_env(wf_arrays)
+                    envs_to_export.append(("Min_Envelope", time, min_env))
+
+                if show_rms:
+                    time, rms_env = compute_rms_env(wf_arrays)
+                    envs_to_export.append(("RMS_Envelope", time, rms_env))
+
+            envs_arg = envs_to_export if envs_to_export else None
+            result = export_fn(
+                filename,
+                wfs_to_export,
+                envs_arg,
+                sample_rate,
+                duration
+            )
+        finally:
+            self._export_results.put(result)
+
+    def _poll_export(self):
+        """Apply the result of a running export once the worker finishes."""
+        try:
+            success, message = self._export_results.get_nowait()
+        except queue.Empty:
+            self.after(EXPORT_POLL_MS, self._poll_export)
+            return
 
-        # Update status
+        self.export_btn.configure(state="normal")
         if success:
             self.export_status.configure(text=message, text_color=_theme["success"])
         else:
@@ -1499,188 +1621,559 @@ class WaveformApp(ctk.CTk):
 
     # === UI Update Methods ===
 
-    def _update_all_plots(self):
-        """Regenerate and update all waveform plots."""
-        self.ax.clear()
+    def _schedule_redraw(self):
+        """Request a plot update, coalescing bursts of requests.
+
+        Callbacks that change plot inputs call this instead of
+        _update_all_plots, so rapid +/- clicks or key repeats regenerate and
+        draw the plot at most once per REDRAW_DELAY_MS.
+        """
+        if self._redraw_after_id is None:
+            self._redraw_after_id = self.after(REDRAW_DELAY_MS, self._flush_redraw)
+
+    def _flush_redraw(self):
+        """Run the pending plot update scheduled by _schedule_redraw."""
+        self._redraw_after_id = None
+        # Sidebar refreshes can change state the plot shows (envelopes are
+        # switched off when too few waveforms are enabled), so run them first
+        if self._updates_after_id is not None:
+            self.after_cancel(self._updates_after_id)
+            self._flush_updates()
+        if self.ax is not None:  # Otherwise _init_plot draws the plot
+            self._update_all_plots()
+
+    def _request_update(self, *names: str):
+        """Request sidebar refreshes, run together once Tk is idle.
+
+        Args:
+            names: Entries of DEFERRED_UPDATES to run.
+        """
+        self._pending_updates.update(names)
+        if self._updates_after_id is None:
+            self._updates_after_id = self.after_idle(self._flush_updates)
+
+    def _flush_updates(self):
+        """Run the sidebar refreshes requested through _request_update."""
+        self._updates_after_id = None
+        pending, self._pending_updates = self._pending_updates, set()
+        for name in DEFERRED_UPDATES:
+            if name in pending:
+                getattr(self, f"_update_{name}")()
+
+    def _get_wf_samples(self, wf: WfState) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (time, amplitude) samples for a waveform.
+
+        Samples are cached per waveform id and only regenerated when one of
+        the waveform's parameters, the duration or the sample rate changes.
+        The amplitudes are a view of the waveform's row in the shared slot
+        buffer and are overwritten in place when it is regenerated; callers
+        must not modify them and should copy them if kept across redraws.
 
-        # Configure axes
+        Args:
+            wf: The WfState to sample.
+
+        Returns:
+            Tuple of (time, amplitude) arrays.
+        """
+        key = (
+            wf.wf_type, wf.freq, wf.amp, wf.offset, wf.duty_cycle,
+            app_state.duration, app_state.sample_rate
+        )
+        cached = self._wf_cache.get(wf.id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        time = self._get_time_axis()
+        samples = gen_wf(*key, time=time, out=self._amp_bufs[wf.id])
+        self._wf_cache[wf.id] = (key, samples)
+        return samples
+
+    def _get_time_axis(self) -> np.ndarray:
+        """Return the time axis for the current duration and sample rate.
+
+        When the axis length changes, the per-slot amplitude buffer is
+        reallocated to match and all cached samples are dropped.
+        """
+        key = (app_state.duration, app_state.sample_rate)
+        if key != self._time_axis_key:
+            self._time_axis = gen_time_axis(*key)
+            self._time_axis_key = key
+            self._amp_bufs = np.empty((app_state.MAX_WFS, len(self._time_axis)))
+            self._wf_cache.clear()
+        return self._time_axis
+
+    def _reset_axes(self):
+        """Clear the axes and recreate the axis styling and plot artists."""
+        self.ax.clear()
         self.ax.set_xlabel("Time (s)")
+        self.ax.grid(visible=True, alpha=0.3, color=_theme["separator"])
+
+        # One line per waveform slot, indexed by waveform id
+        self._wf_lines = [
+            self.ax.plot([], [], linewidth=2, visible=False)[0]
+            for _ in range(app_state.MAX_WFS)
+        ]
+        self._env_lines = {
+            "max": self._create_glowing_line("Max Envelope"),
+            "min": self._create_glowing_line("Min Envelope"),
+            "rms": self._create_glowing_line("RMS Envelope"),
+        }
+        self._p2p_fill: Optional[Any] = None
+        self._legend_key: Optional[tuple] = None
+        self._scene_key: Optional[tuple] = None
+        self._wf_legend_handles: list = []
+
+        # Full-resolution data behind the decimated artists, re-decimated
+        # for the visible range when the view is panned or zoomed; the
+        # first _n_wf_sources entries belong to the waveform lines
+        self._line_sources: list[Tuple[list, np.ndarray, np.ndarray]] = []
+        self._n_wf_sources = 0
+        self._p2p_source: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+        self.ax.callbacks.connect('xlim_changed', self._on_xlim_changed)
+
+        # ax.clear() also removed the cursor artists
+        self._live_cursor_vline = None
+        self._pinned_cursor_vline = None
+        self._pinned_annotation = None
+
+        # Highlight dot and live readout, updated in place on mouse moves
+        self._highlight_marker = self.ax.plot(
+            [], [], 'o', markersize=8,
+            markeredgecolor=_theme["text"], markeredgewidth=1.5,
+            zorder=10, animated=True, visible=False
+        )[0]
+        self._live_annotation = self.ax.annotate(
+            "", xy=(0, 0),
+            xytext=(12, 12), textcoords='offset points',
+            fontsize=8, color=_theme["text"],
+            bbox={
+                'boxstyle': 'round,pad=0.3',
+                'facecolor': _theme["plot_bg"],
+                'alpha': 0.85
+            },
+            zorder=11, animated=True, visible=False
+        )
+
+    def _create_glowing_line(self, label: str) -> list:
+        """Create the hidden glow layers and core line for an envelope.
+
+        Args:
+            label: Legend label for the core line.
+
+        Returns:
+            List of Line2D artists, glow layers first and core line last.
+        """
+        lines = [
+            self.ax.plot([], [], linewidth=lw, alpha=alpha, visible=False)[0]
+            for lw, alpha in zip(GLOW_LINEWIDTHS, GLOW_ALPHAS)
+        ]
+        lines.append(self.ax.plot(
+            [], [], linewidth=GLOW_CORE_WIDTH, alpha=1.0,
+            label=label, visible=False
+        )[0])
+        return lines
+
+    def _update_all_plots(self):
+        """Regenerate and update all waveform plots.
+
+        The line artists created by _reset_axes are updated in place; the
+        axes are not cleared. Nothing is done if none of the state shown
+        on the plot has changed since the last update, and the waveform
+        lines are left as they are when only envelopes were toggled.
+        """
+        scene_key = self._get_scene_key()
+        if scene_key == self._scene_key:
+            return
+        wfs_changed = (
+            self._scene_key is None or scene_key[0] != self._scene_key[0]
+        )
+        self._scene_key = scene_key
+
+        if wfs_changed:
+            self._update_wf_lines()
+        else:
+            # Envelope toggle: keep the waveform lines, drop the envelopes
+            del self._line_sources[self._n_wf_sources:]
+            self._p2p_source = None
+        legend_handles = list(self._wf_legend_handles)
+
+        # Plot envelopes with glow effect
+        self._hide_envelopes()
+        if app_state.can_show_envelopes() and self._cached_wf_data:
+            self._plot_envelopes(legend_handles)
+
+        # Rebuild the legend only when its entries change; envelope colors
+        # only change with the theme, which resets the axes
+        legend_key = tuple(
+            (h.get_label(), h.get_color() if h in self._wf_lines else None)
+            for h in legend_handles
+        )
+        if legend_key != self._legend_key:
+            self._legend_key = legend_key
+            if legend_handles:
+                self.ax.legend(handles=legend_handles, loc='upper right')
+            elif self.ax.get_legend() is not None:
+                self.ax.get_legend().remove()
+
+        # Refresh cursor readouts for the new data
+        self._redraw_cursors()
+
+        # Redraw canvas; cursor moves wait for the new background
+        self._cursor_bg = None
+        self.canvas.draw_idle()
+
+        # Update status bar
+        self._update_status_bar()
+
+    def _update_wf_lines(self):
+        """Regenerate the enabled waveforms and update their lines."""
+        # Configure axes (dropping the old sources first, so the xlim
+        # change does not re-decimate data that is about to be replaced)
+        self._line_sources = []
+        self._p2p_source = None
         self.ax.set_ylabel(self._plot_y_title)
         self.ax.set_xlim(0, app_state.duration)
         self.ax.set_ylim(self._plot_y_min, self._plot_y_max)
-        self.ax.grid(visible=True, alpha=0.3, color=_theme["separator"])
 
         # Generate and plot enabled waveforms
         wf_data: list[Tuple[np.ndarray, np.ndarray]] = []
+        legend_handles: list = []
         for wf in app_state.wfs:
-            if wf.enabled:
-                time, amp = gen_wf(
-                    wf.wf_type,
-                    wf.freq,
-                    wf.amp,
-                    wf.offset,
-                    wf.duty_cycle,
-                    app_state.duration,
-                    app_state.sample_rate
-                )
-                wf_data.append((time, amp))
-
-                # Only plot if not hiding source waveforms
-                if not app_state.hide_src_wfs:
-                    # Convert RGB tuple to matplotlib color format
-                    color = tuple(c / 255 for c in wf.color)
-                    self.ax.plot(
-                        time, amp, color=color,
-                        label=wf.display_name, linewidth=2
-                    )
-
-        # Cache waveform data for cursor proximity checks
-        self._cached_wf_data = wf_data
+            line = self._wf_lines[wf.id]
+            if not wf.enabled:
+                line.set_visible(False)
+                continue
 
-        # Plot envelopes with glow effect
-        if app_state.can_show_envelopes() and wf_data:
-            self._plot_envelopes(wf_data)
+            time, amp = self._get_wf_samples(wf)
+            wf_data.append((time, amp))
+
+            # Only plot if not hiding source waveforms
+            if app_state.hide_src_wfs:
+                line.set_visible(False)
+            else:
+                self._set_lines_data([line], time, amp)
+                line.set_color(wf.mpl_color)
+                line.set_label(wf.display_name)
+                line.set_visible(True)
+                legend_handles.append(line)
+
+        for line in self._wf_lines[len(app_state.wfs):]:
+            line.set_visible(False)
+        self._wf_legend_handles = legend_handles
+        self._n_wf_sources = len(self._line_sources)
+
+        # Cache waveform data for cursor proximity checks; envelopes are
+        # kept while the enabled waveforms' samples are unchanged
+        self._cached_wf_data = wf_data
+        env_key = tuple(
+            self._wf_cache[wf.id][0] for wf in app_state.wfs if wf.enabled
+        )
+        if env_key != self._env_cache_key:
+            self._env_cache.clear()
+            self._env_cache_key = env_key
 
-        # Add legend if there are any lines
-        if self.ax.get_lines():
-            self.ax.legend(loc='upper right')
+    def _get_scene_key(self) -> tuple:
+        """Return a key of all the state that _update_all_plots draws.
 
-        # Redraw cursors (ax.clear removes them)
-        self._redraw_cursors()
+        The key is (waveform state, envelope flags), so envelope toggles
+        can be told apart from changes that need the waveforms redrawn.
+        """
+        wf_keys = tuple(
+            (wf.id, wf.enabled, wf.wf_type, wf.freq, wf.amp, wf.offset,
+             wf.duty_cycle, wf.display_name, wf.mpl_color)
+            for wf in app_state.wfs
+        )
+        return (
+            (wf_keys, app_state.duration, app_state.sample_rate,
+             app_state.hide_src_wfs, self._plot_y_title,
+             self._plot_y_min, self._plot_y_max),
+            (app_state.show_max_env, app_state.show_min_env,
+             app_state.show_rms_env),
+        )
 
-        # Redraw canvas
-        self.canvas.draw()
+    def _hide_envelopes(self):
+        """Hide all envelope lines and remove the peak-to-peak fill."""
+        for lines in self._env_lines.values():
+            for line in lines:
+                line.set_visible(False)
+        if self._p2p_fill is not None:
+            self._p2p_fill.remove()
+            self._p2p_fill = None
 
-        # Update status bar
-        self._update_status_bar()
+    def _plot_envelopes(self, legend_handles: list) -> None:
+        """Plot all enabled envelope lines with glow effects and P2P fill.
 
-    def _plot_envelopes(self, wf_data: list) -> None:
-        """Plot all enabled envelope lines with glow effects and P2P fill."""
+        Args:
+            legend_handles: Legend handles list, extended in legend order.
+        """
         max_env_data = None
         min_env_data = None
 
         if app_state.show_max_env:
-            max_env_data = compute_max_env(wf_data)
-            self._plot_glowing_line(
-                max_env_data[0], max_env_data[1],
-                _theme["success"], 'Max Envelope'
-            )
+            max_env_data = self._get_envelope("max")
+            legend_handles.append(self._plot_glowing_line(
+                self._env_lines["max"], max_env_data[0], max_env_data[1],
+                _theme["success"]
+            ))
 
         if app_state.show_min_env:
-            min_env_data = compute_min_env(wf_data)
-            self._plot_glowing_line(
-                min_env_data[0], min_env_data[1],
-                _theme["error"], 'Min Envelope'
-            )
+            min_env_data = self._get_envelope("min")
+            legend_handles.append(self._plot_glowing_line(
+                self._env_lines["min"], min_env_data[0], min_env_data[1],
+                _theme["error"]
+            ))
 
         # Peak-to-Peak fill between max and min
         if max_env_data is not None and min_env_data is not None:
-            self.ax.fill_between(
-                max_env_data[0], min_env_data[1], max_env_data[1],
-                alpha=0.12, color=_theme["p2p_fill"], label="Peak-to-Peak"
+            self._p2p_source = (
+                max_env_data[0], min_env_data[1], max_env_data[1]
             )
+            self._draw_p2p_fill()
+            legend_handles.append(self._p2p_fill)
 
         if app_state.show_rms_env:
-            time_rms, rms_env = compute_rms_env(wf_data)
-            self._plot_glowing_line(
-                time_rms, rms_env, _theme["rms"], 'RMS Envelope'
-            )
+            time_rms, rms_env = self._get_envelope("rms")
+            legend_handles.append(self._plot_glowing_line(
+                self._env_lines["rms"], time_rms, rms_env, _theme["rms"]
+            ))
+
+    def _get_envelope(self, kind: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Return an envelope of the plotted waveforms, computing it once.
+
+        Args:
+            kind: "max", "min" or "rms".
+
+        Returns:
+            Tuple of (time array, envelope array).
+        """
+        env = self._env_cache.get(kind)
+        if env is None:
+            env = ENV_FUNCS[kind](self._cached_wf_data)
+            self._env_cache[kind] = env
+        return env
+
+    def _plot_glowing_line(self, lines: list, x: Any, y: Any, color: str) -> Any:
+        """Show an envelope's glow layers and core line with new data.
+
+        Args:
+            lines: Artists from _create_glowing_line.
+            x: Time values.
+            y: Envelope values.
+            color: Line color.
 
-    def _plot_glowing_line(self, x: Any, y: Any, color: str, label: str):
-        """Plot a line with a glow effect using layered transparency."""
-        for lw, alpha in zip(GLOW_LINEWIDTHS, GLOW_ALPHAS):
-            self.ax.plot(x, y, color=color, linewidth=lw, alpha=alpha)
-        self.ax.plot(
-            x, y, color=color, linewidth=GLOW_CORE_WIDTH,
-            alpha=1.0, label=label
+        Returns:
+            The core line, for use as the legend handle.
+        """
+        self._set_lines_data(lines, x, y)
+        for line in lines:
+            line.set_color(color)
+            line.set_visible(True)
+        return lines[-1]
+
+    def _draw_p2p_fill(self):
+        """(Re)create the peak-to-peak fill from the decimated envelopes."""
+        if self._p2p_fill is not None:
+            self._p2p_fill.remove()
+        time, lower, upper = self._p2p_source
+        start, stop = self._visible_range(time)
+        idx = np.union1d(
+            self._decimate(lower[start:stop]), self._decimate(upper[start:stop])
+        ) + start
+        self._p2p_fill = self.ax.fill_between(
+            time[idx], lower[idx], upper[idx],
+            alpha=0.12, color=_theme["p2p_fill"], label="Peak-to-Peak"
         )
 
-    def _update_wf_list(self):
-        """Update the waveform list UI."""
-        # Clear existing widgets safely
-        children = list(self.wf_list_frame.winfo_children())
-        for widget in children:
-            try:
-                widget.destroy()
-            except Exception:
-                pass
+    def _set_lines_data(self, lines: list, x: np.ndarray, y: np.ndarray):
+        """Set decimated data on lines and remember the full-resolution source.
 
-        self.wf_buttons = []
-        self.toggle_buttons = []
-        self.remove_buttons = []
+        Plotting every sample of a long trace only costs render time, since
+        many samples land on the same pixel; the full arrays remain in
+        _cached_wf_data for cursors and are used for export.
 
-        for wf in app_state.wfs:
-            row_frame = ctk.CTkFrame(self.wf_list_frame, fg_color="transparent")
-            row_frame.pack(fill="x", pady=SP_XS)
-
-            # Selection button (WinUI outlined style)
-            is_selected = wf.id == app_state.active_wf_index
-            fg_color = _theme["selected_bg"] if is_selected else "transparent"
-            border_color = (
-                _theme["selected_border"] if is_selected else _theme["border"]
-            )
-            border_width = 2 if is_selected else 1
+        Args:
+            lines: Line2D artists that all show this trace.
+            x: Full-resolution time values.
+            y: Full-resolution sample values.
+        """
+        self._line_sources.append((lines, x, y))
+        self._apply_decimated(lines, x, y)
+
+    def _apply_decimated(self, lines: list, x: np.ndarray, y: np.ndarray):
+        """Set the visible part of a trace, decimated, on its lines."""
+        start, stop = self._visible_range(x)
+        idx = self._decimate(y[start:stop]) + start
+        x_plot, y_plot = x[idx], y[idx]
+        for line in lines:
+            line.set_data(x_plot, y_plot)
+
+    def _visible_range(self, x: np.ndarray) -> Tuple[int, int]:
+        """Return (start, stop) indices of x within the x limits, plus one
+        sample either side so lines reach the plot edges.
+        """
+        x_min, x_max = self.ax.get_xlim()
+        start = max(int(np.searchsorted(x, x_min)) - 1, 0)
+        stop = min(int(np.searchsorted(x, x_max)) + 1, len(x))
+        return start, stop
+
+    def _decimate(self, y: np.ndarray) -> np.ndarray:
+        """Return min/max decimation indices sized to the axes width."""
+        max_points = PLOT_POINTS_PER_PIXEL * int(self.ax.bbox.width)
+        return decimate_indices(y, max_points)
+
+    def _on_xlim_changed(self, ax: Any):
+        """Re-decimate the plotted traces for the new view after pan/zoom."""
+        for lines, x, y in self._line_sources:
+            self._apply_decimated(lines, x, y)
+        if self._p2p_source is not None:
+            self._draw_p2p_fill()
+
+    def _on_canvas_resize(self, event: Any):
+        """Re-decimate the plotted traces for the new axes width.
+
+        Covers window resizes and detaching or re-attaching the plot,
+        which change the pixel width without a plot update.
+        """
+        self._on_xlim_changed(self.ax)
 
-            wf_btn = ctk.CTkButton(
-                row_frame,
-                text=wf.display_name,
-                width=180,
-                fg_color=fg_color,
-                hover_color=_theme["selected_bg"],
-                border_color=border_color,
-                border_width=border_width,
-                text_color=_theme["text"],
-                corner_radius=RADIUS_SMALL,
-                font=self._font_body,
-                command=lambda wid=wf.id: self._on_select_wf(wid)
-            )
-            wf_btn.pack(side="left", padx=(0, SP_XS))
-            self.wf_buttons.append(wf_btn)
+    def _update_wf_list(self):
+        """Update the waveform list UI.
 
-            # Right-click context menu for renaming
-            wf_btn.bind(
-                "<Button-3>",
-                lambda e, wid=wf.id: self._show_wf_context_menu(e, wid)
+        Existing rows are reconfigured in place, and only for the options
+        that differ; rows are only created or destroyed when the number of
+        waveforms changes. Nothing is done if
+        the rows already show the current names, flags and selection.
+        """
+        num_wfs = len(app_state.wfs)
+        list_key = (
+            tuple((wf.display_name, wf.enabled) for wf in app_state.wfs),
+            app_state.active_wf_index,
+            app_state.hide_src_wfs,
+        )
+        if list_key == self._wf_list_key and len(self._wf_rows) == num_wfs:
+            return
+        self._wf_list_key = list_key
+
+        while len(self._wf_rows) < num_wfs:
+            self._create_wf_row(len(self._wf_rows))
+        self._destroy_wf_rows(num_wfs)
+
+        show_remove = num_wfs > app_state.MIN_WFS
+        remove_enabled = not app_state.hide_src_wfs
+        remove_color = _theme["remove_btn"] if remove_enabled else _theme["wf_off"]
+        remove_state = CONTROL_STATES[remove_enabled]
+        active_index = app_state.active_wf_index
+
+        for wf, wf_btn, vis_btn, remove_btn in zip(
+            app_state.wfs, self.wf_buttons,
+            self.toggle_buttons, self.remove_buttons
+        ):
+            # Selection button (WinUI outlined style); only the widgets of
+            # rows that actually changed are reconfigured
+            is_selected = wf.id == active_index
+            self._configure_if_changed(
+                wf_btn,
+                text=wf.display_name,
+                fg_color=_theme["selected_bg"] if is_selected else "transparent",
+                border_color=(
+                    _theme["selected_border"] if is_selected else _theme["border"]
+                ),
+                border_width=2 if is_selected else 1
             )
 
-            # Hover tooltip
-            wf_btn.bind("<Enter>", self._show_tooltip)
-            wf_btn.bind("<Leave>", self._hide_tooltip)
-
             # Visibility toggle button
-            vis_text = "ON" if wf.enabled else "OFF"
-            vis_color = _theme["wf_on"] if wf.enabled else _theme["wf_off"]
-            vis_btn = ctk.CTkButton(
-                row_frame,
-                text=vis_text,
-                width=40,
-                fg_color=vis_color,
-                hover_color=_theme["wf_on"],
-                text_color="#FFFFFF",
-                corner_radius=RADIUS_SMALL,
-                font=self._font_caption,
-                command=lambda wid=wf.id: self._on_toggle_wf(wid)
+            self._configure_if_changed(
+                vis_btn,
+                text="ON" if wf.enabled else "OFF",
+                fg_color=_theme["wf_on"] if wf.enabled else _theme["wf_off"]
             )
-            vis_btn.pack(side="left", padx=SP_XS)
-            self.toggle_buttons.append(vis_btn)
 
             # Remove button (only show if more than 1 waveform)
-            if len(app_state.wfs) > app_state.MIN_WFS:
-                is_enabled = not app_state.hide_src_wfs
-                remove_btn = ctk.CTkButton(
-                    row_frame,
-                    text="X",
-                    width=30,
-                    fg_color=_theme["remove_btn"] if is_enabled else _theme["wf_off"],
-                    hover_color=_theme["remove_btn"],
-                    state="normal" if is_enabled else "disabled",
-                    text_color="#FFFFFF",
-                    corner_radius=RADIUS_SMALL,
-                    font=self._font_caption,
-                    command=lambda wid=wf.id: self._on_remove_wf(wid)
+            if show_remove:
+                self._configure_if_changed(
+                    remove_btn, fg_color=remove_color, state=remove_state
                 )
-                remove_btn.pack(side="left", padx=SP_XS)
-                self.remove_buttons.append(remove_btn)
+                if not remove_btn.winfo_manager():
+                    remove_btn.pack(side="left", padx=SP_XS)
+            elif remove_btn.winfo_manager():
+                remove_btn.pack_forget()
+
+    def _create_wf_row(self, index: int):
+        """Create the list row widgets for the waveform at ``index``.
+
+        Waveform ids always equal their list position, so the row's
+        callbacks are bound to the index once. Text and colors are set by
+        _update_wf_list.
+
+        Args:
+            index: Row index (and waveform id) of the new row.
+        """
+        row_frame = ctk.CTkFrame(self.wf_list_frame, fg_color="transparent")
+        row_frame.pack(fill="x", pady=SP_XS)
+        self._wf_rows.append(row_frame)
+
+        # Selection button
+        wf_btn = ctk.CTkButton(
+            row_frame,
+            text="",
+            width=180,
+            hover_color=_theme["selected_bg"],
+            text_color=_theme["text"],
+            corner_radius=RADIUS_SMALL,
+            font=self._font_body,
+            command=lambda: self._on_select_wf(index)
+        )
+        wf_btn.pack(side="left", padx=(0, SP_XS))
+        self.wf_buttons.append(wf_btn)
+
+        # Right-click context menu for renaming
+        wf_btn.bind(
+            "<Button-3>",
+            lambda e: self._show_wf_context_menu(e, index)
+        )
+
+        # Hover tooltip
+        wf_btn.bind("<Enter>", self._show_tooltip)
+        wf_btn.bind("<Leave>", self._hide_tooltip)
+
+        # Visibility toggle button
+        vis_btn = ctk.CTkButton(
+            row_frame,
+            text="",
+            width=40,
+            hover_color=_theme["wf_on"],
+            text_color="#FFFFFF",
+            corner_radius=RADIUS_SMALL,
+            font=self._font_caption,
+            command=lambda: self._on_toggle_wf(index)
+        )
+        vis_btn.pack(side="left", padx=SP_XS)
+        self.toggle_buttons.append(vis_btn)
+
+        # Remove button (packed by _update_wf_list when removal is allowed)
+        remove_btn = ctk.CTkButton(
+            row_frame,
+            text="X",
+            width=30,
+            hover_color=_theme["remove_btn"],
+            text_color="#FFFFFF",
+            corner_radius=RADIUS_SMALL,
+            font=self._font_caption,
+            command=lambda: self._on_remove_wf(index)
+        )
+        self.remove_buttons.append(remove_btn)
+
+    def _destroy_wf_rows(self, keep: int):
+        """Destroy waveform list rows beyond the first ``keep`` rows."""
+        for row_frame in self._wf_rows[keep:]:
+            try:
+                row_frame.destroy()
+            except Exception:
+                pass  # Row may be mid-callback (e.g. its remove button)
+        del self._wf_rows[keep:]
+        del self.wf_buttons[keep:]
+        del self.toggle_buttons[keep:]
+        del self.remove_buttons[keep:]
 
     def _update_wf_parameters(self):
         """Update waveform parameter inputs based on active waveform."""
@@ -1688,29 +2181,21 @@ class WaveformApp(ctk.CTk):
         if not wf:
             return
 
-        # Update entry fields
-        self.freq_entry.delete(0, "end")
-        self.freq_entry.insert(0, f"{wf.freq:.1f}")
-
-        self.amp_entry.delete(0, "end")
-        self.amp_entry.insert(0, f"{wf.amp:.1f}")
-
-        self.offset_entry.delete(0, "end")
-        self.offset_entry.insert(0, f"{wf.offset:.1f}")
-
-        self.duty_entry.delete(0, "end")
-        self.duty_entry.insert(0, f"{wf.duty_cycle:.1f}")
-
-        self.wf_type_combo.set(wf.wf_type.capitalize())
+        # Update entry fields and button states
+        for key, (attr, _, _, _) in WF_PARAMS.items():
+            self._set_entry_text(
+                getattr(self, f"{key}_var"), f"{getattr(wf, attr):.1f}"
+            )
+            self._update_param_btns(key, wf)
 
-        # Update button states
-        self._update_freq_btns()
-        self._update_amp_btns()
-        self._update_offset_btns()
-        self._update_duty_btns()
+        type_text = wf.wf_type.capitalize()
+        if self.wf_type_combo.get() != type_text:
+            self.wf_type_combo.set(type_text)
 
-        # Show/hide duty cycle for square waves
+        # Show/hide duty cycle for square waves (repacking only on change)
         needs_duty = wf.wf_type.lower() == 'square'
+        if needs_duty == bool(self.duty_frame.winfo_manager()):
+            return
         if needs_duty:
             self.duty_label.pack(
                 anchor="w", padx=SP_MD,
@@ -1728,104 +2213,82 @@ class WaveformApp(ctk.CTk):
         """Update duration button states."""
         at_min = app_state.duration <= DURATION_MIN
         at_max = app_state.duration >= DURATION_MAX
-        self.duration_dec_btn.configure(state="disabled" if at_min else "normal")
-        self.duration_inc_btn.configure(state="disabled" if at_max else "normal")
-
-    def _update_freq_btns(self):
-        """Update frequency button states."""
-        wf = app_state.get_active_wf()
-        if wf:
-            at_min = wf.freq <= FREQ_MIN
-            at_max = wf.freq >= FREQ_MAX
-            self.freq_dec_btn.configure(state="disabled" if at_min else "normal")
-            self.freq_inc_btn.configure(state="disabled" if at_max else "normal")
+        self._configure_if_changed(
+            self.duration_dec_btn, state=CONTROL_STATES[not at_min]
+        )
+        self._configure_if_changed(
+            self.duration_inc_btn, state=CONTROL_STATES[not at_max]
+        )
 
-    def _update_amp_btns(self):
-        """Update amplitude button states."""
-        wf = app_state.get_active_wf()
-        if wf:
-            at_min = wf.amp <= AMP_MIN
-            at_max = wf.amp >= AMP_MAX
-            self.amp_dec_btn.configure(state="disabled" if at_min else "normal")
-            self.amp_inc_btn.configure(state="disabled" if at_max else "normal")
+    def _update_param_btns(self, key: str, wf: WfState):
+        """Update the +/- button states of a waveform parameter.
 
-    def _update_offset_btns(self):
-        """Update offset button states."""
-        wf = app_state.get_active_wf()
-        if wf:
-            at_min = wf.offset <= OFFSET_MIN
-            at_max = wf.offset >= OFFSET_MAX
-            self.offset_dec_btn.configure(state="disabled" if at_min else "normal")
-            self.offset_inc_btn.configure(state="disabled" if at_max else "normal")
-
-    def _update_duty_btns(self):
-        """Update duty cycle button states."""
-        wf = app_state.get_active_wf()
-        if wf:
-            at_min = wf.duty_cycle <= DUTY_MIN
-            at_max = wf.duty_cycle >= DUTY_MAX
-            self.duty_dec_btn.configure(state="disabled" if at_min else "normal")
-            self.duty_inc_btn.configure(state="disabled" if at_max else "normal")
+        Args:
+            key: WF_PARAMS key of the parameter.
+            wf: Active waveform, as already looked up by the caller.
+        """
+        attr, min_val, max_val, _ = WF_PARAMS[key]
+        value = getattr(wf, attr)
+        self._configure_if_changed(
+            getattr(self, f"{key}_dec_btn"),
+            state=CONTROL_STATES[value > min_val]
+        )
+        self._configure_if_changed(
+            getattr(self, f"{key}_inc_btn"),
+            state=CONTROL_STATES[value < max_val]
+        )
 
     def _update_env_controls(self):
         """Enable/disable envelope checkboxes based on number of enabled waveforms."""
         can_show = app_state.can_show_envelopes()
-
-        # Update max envelope checkbox
-        self.show_max_env_cb.configure(state="normal" if can_show else "disabled")
-        self.show_max_env_label.configure(
-            text_color=_theme["text"] if can_show else _theme["text_disabled"]
-        )
-
-        # Update min envelope checkbox
-        self.show_min_env_cb.configure(state="normal" if can_show else "disabled")
-        self.show_min_env_label.configure(
-            text_color=_theme["text"] if can_show else _theme["text_disabled"]
-        )
-
-        # Update RMS envelope checkbox
-        self.show_rms_env_cb.configure(state="normal" if can_show else "disabled")
-        self.show_rms_env_label.configure(
-            text_color=_theme["text"] if can_show else _theme["text_disabled"]
-        )
+        cb_state = CONTROL_STATES[can_show]
+        label_color = _theme["text"] if can_show else _theme["text_disabled"]
+
+        for cb, label, var, attr in self._env_rows:
+            self._configure_if_changed(cb, state=cb_state)
+            self._configure_if_changed(label, text_color=label_color)
+            if not can_show:
+                setattr(app_state, attr, False)
+                # Setting a checkbox variable redraws the checkbox via its
+                # write trace, so only clear the ones that are checked
+                if var.get():
+                    var.set(False)
 
         if not can_show:
-            app_state.show_max_env = False
-            app_state.show_min_env = False
-            app_state.show_rms_env = False
             app_state.hide_src_wfs = False
-            self.show_max_env_var.set(False)
-            self.show_min_env_var.set(False)
-            self.show_rms_env_var.set(False)
 
     def _update_add_button(self):
         """Enable/disable add waveform button based on max limit and hide_src state."""
         can_add = len(app_state.wfs) < app_state.MAX_WFS and not app_state.hide_src_wfs
-        self.add_wf_btn.configure(state="normal" if can_add else "disabled")
-
-    def _update_wf_management_controls(self):
-        """Enable/disable waveform management controls based on hide_src state."""
-        self._update_add_button()
-        self._update_wf_list()
+        self._configure_if_changed(
+            self.add_wf_btn, state=CONTROL_STATES[can_add]
+        )
 
     # === Cursor Methods ===
 
     def _on_mouse_move(self, event: Any):
         """Handle mouse movement over the plot for live cursor tracking."""
         if event.inaxes != self.ax:
+            if self._live_cursor_x is None:
+                return  # Live cursor already cleared
+            self._last_mouse_px = None
             # Remove live cursor when mouse leaves plot
             if self._live_cursor_vline and self._live_cursor_vline in self.ax.lines:
                 self._live_cursor_vline.remove()
                 self._live_cursor_vline = None
-            self._remove_highlight_marker()
-            if self._live_annotation is not None:
-                self._live_annotation.remove()
-                self._live_annotation = None
+            self._hide_live_readout()
             self._live_cursor_x = None
             self._highlighted_wf_name = None
-            self.canvas.draw_idle()
+            self._blit_cursor()
             return
 
+        # Sub-pixel motion would redraw the cursor in the same place
+        last = self._last_mouse_px
+        if (last is not None and abs(event.x - last[0]) < 1
+                and abs(event.y - last[1]) < 1):
+            return
+        self._last_mouse_px = (event.x, event.y)
+
         self._live_cursor_x = event.xdata
 
         # Find nearest waveform for highlight
@@ -1834,42 +2297,25 @@ class WaveformApp(ctk.CTk):
         cursor_alpha = 0.5
         cursor_width = 1
 
-        # Remove old live annotation
-        if self._live_annotation is not None:
-            self._live_annotation.remove()
-            self._live_annotation = None
-
         if nearest is not None:
             wf_name, wf_y, wf_color = nearest
             self._highlighted_wf_name = wf_name
             cursor_color = wf_color
             cursor_alpha = 0.8
             cursor_width = 1.5
-            # Update or create highlight marker dot
-            self._remove_highlight_marker()
-            self._highlight_marker = self.ax.plot(
-                event.xdata, wf_y, 'o',
-                color=wf_color, markersize=8,
-                markeredgecolor=_theme["text"], markeredgewidth=1.5,
-                zorder=10
-            )[0]
-            # Show live value annotation
-            self._live_annotation = self.ax.annotate(
-                f"{wf_name}\nt={event.xdata:.4f}s\ny={wf_y:.4f}",
-                xy=(event.xdata, wf_y),
-                xytext=(12, 12), textcoords='offset points',
-                fontsize=8, color=_theme["text"],
-                bbox={
-                    'boxstyle': 'round,pad=0.3',
-                    'facecolor': _theme["plot_bg"], 
-                    'edgecolor': wf_color,
-                    'alpha': 0.85
-                },
-                zorder=11
+            # Move the highlight dot and live value readout
+            self._highlight_marker.set_data([event.xdata], [wf_y])
+            self._highlight_marker.set_color(wf_color)
+            self._highlight_marker.set_visible(True)
+            self._live_annotation.set_text(
+                f"{wf_name}\nt={event.xdata:.4f}s\ny={wf_y:.4f}"
             )
+            self._live_annotation.xy = (event.xdata, wf_y)
+            self._live_annotation.get_bbox_patch().set_edgecolor(wf_color)
+            self._live_annotation.set_visible(True)
         else:
             self._highlighted_wf_name = None
-            self._remove_highlight_marker()
+            self._hide_live_readout()
 
         # Update or create live cursor line
         if self._live_cursor_vline and self._live_cursor_vline in self.ax.lines:
@@ -1880,10 +2326,11 @@ class WaveformApp(ctk.CTk):
         else:
             self._live_cursor_vline = self.ax.axvline(
                 event.xdata, color=cursor_color,
-                linestyle='-', linewidth=cursor_width, alpha=cursor_alpha
+                linestyle='-', linewidth=cursor_width, alpha=cursor_alpha,
+                animated=True
             )
 
-        self.canvas.draw_idle()
+        self._blit_cursor()
 
     def _find_nearest_wf(
         self, x: float, y: float
@@ -1904,53 +2351,42 @@ class WaveformApp(ctk.CTk):
         if not wf_data:
             return None
 
-        # Check envelope lines when they're visible
-        if app_state.can_show_envelopes() and wf_data:
-            env_candidates: list[Tuple[str, float, str]] = []
-
+        # Candidate lines as (name, amplitude, color): envelope lines when
+        # they're visible, individual waveforms when they're visible
+        candidates: list[Tuple[str, np.ndarray, str]] = []
+        if app_state.can_show_envelopes():
             if app_state.show_max_env:
-                _, max_env = compute_max_env(wf_data)
-                env_y = float(np.interp(x, wf_data[0][0], max_env))
-                env_candidates.append(("Max Envelope", env_y, _theme["success"]))
-
+                candidates.append(
+                    ("Max Envelope", self._get_envelope("max")[1], _theme["success"])
+                )
             if app_state.show_min_env:
-                _, min_env = compute_min_env(wf_data)
-                env_y = float(np.interp(x, wf_data[0][0], min_env))
-                env_candidates.append(("Min Envelope", env_y, _theme["error"]))
-
+                candidates.append(
+                    ("Min Envelope", self._get_envelope("min")[1], _theme["error"])
+                )
             if app_state.show_rms_env:
-                _, rms_env = compute_rms_env(wf_data)
-                env_y = float(np.interp(x, wf_data[0][0], rms_env))
-                env_candidates.append(("RMS Envelope", env_y, _theme["rms"]))
-
-            for name, env_y, color in env_candidates:
-                dist = abs(y - env_y)
-                if dist < best_dist:
-                    best_dist = dist
-                    best_result = (name, env_y, color)
-
-        # Check individual waveforms when they're visible
+                candidates.append(
+                    ("RMS Envelope", self._get_envelope("rms")[1], _theme["rms"])
+                )
         if not app_state.hide_src_wfs:
-            for wf, (time, amp) in zip(
+            for wf, (_, amp) in zip(
                 [w for w in app_state.wfs if w.enabled], wf_data
             ):
-                wf_y = float(np.interp(x, time, amp))
-                dist = abs(y - wf_y)
-                if dist < best_dist:
-                    best_dist = dist
-                    color_hex = '#{:02x}{:02x}{:02x}'.format(*wf.color)
-                    best_result = (wf.display_name, wf_y, color_hex)
+                candidates.append((wf.display_name, amp, wf.hex_color))
+
+        # All lines share the time axis, so it is searched once
+        values = interp_at(x, wf_data[0][0], [amp for _, amp, _ in candidates])
+        for (name, _, color), line_y in zip(candidates, values):
+            dist = abs(y - line_y)
+            if dist < best_dist:
+                best_dist = dist
+                best_result = (name, line_y, color)
 
         return best_result
 
-    def _remove_highlight_marker(self):
-        """Remove the highlight dot from the plot."""
-        if self._highlight_marker is not None:
-            try:
-                self._highlight_marker.remove()
-            except ValueError:
-                pass
-            self._highlight_marker = None
+    def _hide_live_readout(self):
+        """Hide the highlight dot and the live value readout."""
+        self._highlight_marker.set_visible(False)
+        self._live_annotation.set_visible(False)
 
     def _create_cursor_annotation(
         self, x: float, pinned: bool = False
@@ -1982,15 +2418,15 @@ class WaveformApp(ctk.CTk):
         # Envelopes
         if any_envelope:
             if app_state.show_max_env:
-                _, env = compute_max_env(wf_data)
+                _, env = self._get_envelope("max")
                 val = float(np.interp(x, wf_data[0][0], env))
                 lines.append(f"Max: {val:.4f}")
             if app_state.show_min_env:
-                _, env = compute_min_env(wf_data)
+                _, env = self._get_envelope("min")
                 val = float(np.interp(x, wf_data[0][0], env))
                 lines.append(f"Min: {val:.4f}")
             if app_state.show_rms_env:
-                _, env = compute_rms_env(wf_data)
+                _, env = self._get_envelope("rms")
                 val = float(np.interp(x, wf_data[0][0], env))
                 lines.append(f"RMS: {val:.4f}")
 
@@ -2041,32 +2477,72 @@ class WaveformApp(ctk.CTk):
             event.xdata, pinned=True
         )
 
+        # The pinned cursor is part of the background, so redraw it all
+        self._cursor_bg = None
         self.canvas.draw_idle()
 
     def _redraw_cursors(self):
-        """Re-draw cursor lines after ax.clear() and update readout."""
-        # ax.clear() already removed these, reset references
-        self._highlight_marker = None
-        self._pinned_annotation = None
-        self._live_annotation = None
+        """Refresh cursor artists after the plotted data changes."""
+        # Highlight and live readout are recalculated on next mouse move
+        self._last_mouse_px = None
+        self._hide_live_readout()
+        if self._pinned_annotation is not None:
+            self._pinned_annotation.remove()
+            self._pinned_annotation = None
 
-        # Redraw pinned cursor and annotation
+        # Pinned cursor and annotation with values of the new data
         if self._pinned_cursor_x is not None:
-            self._pinned_cursor_vline = self.ax.axvline(
-                self._pinned_cursor_x, color=_theme["cursor_pinned"],
-                linestyle='--', linewidth=1, alpha=0.7
-            )
+            if self._pinned_cursor_vline is None:
+                self._pinned_cursor_vline = self.ax.axvline(
+                    self._pinned_cursor_x, color=_theme["cursor_pinned"],
+                    linestyle='--', linewidth=1, alpha=0.7
+                )
             self._pinned_annotation = self._create_cursor_annotation(
                 self._pinned_cursor_x, pinned=True
             )
-        # Redraw live cursor (highlight recalculated on next mouse move)
+
+        # Live cursor back to its default style
         if self._live_cursor_x is not None:
-            self._live_cursor_vline = self.ax.axvline(
-                self._live_cursor_x, color=_theme["cursor_default"],
-                linestyle='-', linewidth=1, alpha=0.5
-            )
+            if self._live_cursor_vline is None:
+                self._live_cursor_vline = self.ax.axvline(
+                    self._live_cursor_x, color=_theme["cursor_default"],
+                    linestyle='-', linewidth=1, alpha=0.5, animated=True
+                )
+            else:
+                self._live_cursor_vline.set_color(_theme["cursor_default"])
+                self._live_cursor_vline.set_alpha(0.5)
+                self._live_cursor_vline.set_linewidth(1)
+
+    def _on_canvas_draw(self, event: Any):
+        """Save the freshly drawn plot and draw the live cursor over it.
+
+        The live cursor artists are animated, so full draws leave them out
+        and the saved image can be reused as the background for blitting.
+        """
+        self._cursor_bg = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_cursor_artists()
+
+    def _draw_cursor_artists(self):
+        """Render the live cursor line, highlight dot and readout."""
+        for artist in (
+            self._live_cursor_vline, self._highlight_marker, self._live_annotation
+        ):
+            if artist is not None and artist.get_visible():
+                self.ax.draw_artist(artist)
+
+    def _blit_cursor(self):
+        """Redraw just the live cursor artists over the saved background."""
+        if self._cursor_bg is None:
+            # A full draw is pending, which draws the cursor as well
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._cursor_bg)
+        self._draw_cursor_artists()
+        self.canvas.blit(self.fig.bbox)
 
     def _update_status_bar(self):
         """Update status bar with current info."""
         num_wfs = len(app_state.wfs)
-        self.status_bar.configure(text=f"Waveforms: {num_wfs}/{app_state.MAX_WFS}")
+        self._configure_if_changed(
+            self.status_bar, text=f"Waveforms: {num_wfs}/{app_state.MAX_WFS}"
+        )
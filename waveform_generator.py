@@ -6,8 +6,43 @@ No UI or state management logic.
 """
 
 import numpy as np
-from scipy import signal
-from typing import Tuple, List
+from typing import Tuple, List, Optional
+
+
+def gen_time_axis(dur: float = 1.0, sample_rate: int = 1000) -> np.ndarray:
+    """
+    Generate the sample times shared by all waveforms of a duration.
+
+    Args:
+        dur: Duration in seconds
+        sample_rate: Samples per second
+
+    Returns:
+        Time array
+    """
+    return np.linspace(0, dur, int(sample_rate * dur))
+
+
+def _phase(
+    freq: float, time: np.ndarray, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Return the phase of each sample wrapped to [0, 2*pi), in ``out`` if given."""
+    phase = np.multiply(time, 2 * np.pi * freq, out=out)
+    return np.mod(phase, 2 * np.pi, out=phase)
+
+
+def _reduce_amps(
+    wfs: List[Tuple[np.ndarray, np.ndarray]], func: np.ufunc
+) -> np.ndarray:
+    """Combine the amplitude arrays elementwise with a binary ufunc.
+
+    The result is accumulated into a copy of the first array instead of
+    stacking every array into an (n_wfs, n_samples) temporary first.
+    """
+    result = wfs[0][1].copy()
+    for _, amp in wfs[1:]:
+        func(result, amp, out=result)
+    return result
 
 
 def gen_sine_wf(
@@ -15,7 +50,9 @@ def gen_sine_wf(
     amp: float,
     offset: float = 0.0,
     dur: float = 1.0,
-    sample_rate: int = 1000
+    sample_rate: int = 1000,
+    time: Optional[np.ndarray] = None,
+    out: Optional[np.ndarray] = None
 ) -> Tuple[np.ndarray, np.ndarray]:
     """
     Generate a sine waveform with configurable y-axis offset.
@@ -26,13 +63,21 @@ def gen_sine_wf(
         offset: Y-axis offset (0.0-10.0)
         dur: Duration in seconds
         sample_rate: Samples per second
+        time: Time axis from gen_time_axis(dur, sample_rate), to share one
+            array between waveforms; generated when omitted
+        out: Array of the same length as the time axis to write the
+            amplitudes into; a new array is allocated when omitted
 
     Returns:
         Tuple of (time array, amplitude array)
     """
-    time = np.linspace(0, dur, int(sample_rate * dur))
+    if time is None:
+        time = gen_time_axis(dur, sample_rate)
     half_amp = amp / 2
-    wf = offset + half_amp * np.sin(2 * np.pi * freq * time)
+    wf = np.multiply(time, 2 * np.pi * freq, out=out)
+    np.sin(wf, out=wf)
+    wf *= half_amp
+    wf += offset
     return time, wf
 
 
@@ -42,7 +87,9 @@ def gen_square_wf(
     duty_cycle: float,
     offset: float = 0.0,
     dur: float = 1.0,
-    sample_rate: int = 1000
+    sample_rate: int = 1000,
+    time: Optional[np.ndarray] = None,
+    out: Optional[np.ndarray] = None
 ) -> Tuple[np.ndarray, np.ndarray]:
     """
     Generate a square waveform with configurable y-axis offset.
@@ -54,16 +101,22 @@ def gen_square_wf(
         offset: Y-axis offset (0.0-10.0)
         dur: Duration in seconds
         sample_rate: Samples per second
+        time: Time axis from gen_time_axis(dur, sample_rate), to share one
+            array between waveforms; generated when omitted
+        out: Array of the same length as the time axis to write the
+            amplitudes into; a new array is allocated when omitted
 
     Returns:
         Tuple of (time array, amplitude array)
     """
-    time = np.linspace(0, dur, int(sample_rate * dur))
+    if time is None:
+        time = gen_time_axis(dur, sample_rate)
     half_amp = amp / 2
-    wf = offset + half_amp * signal.square(
-        2 * np.pi * freq * time,
-        duty=duty_cycle / 100
-    )
+    # High for the first duty_cycle percent of each period
+    wf = _phase(freq, time, out)
+    high = wf < 2 * np.pi * (duty_cycle / 100)
+    wf.fill(offset - half_amp)
+    wf[high] = offset + half_amp
     return time, wf
 
 
@@ -72,7 +125,9 @@ def gen_sawtooth_wf(
     amp: float,
     offset: float = 0.0,
     dur: float = 1.0,
-    sample_rate: int = 1000
+    sample_rate: int = 1000,
+    time: Optional[np.ndarray] = None,
+    out: Optional[np.ndarray] = None
 ) -> Tuple[np.ndarray, np.ndarray]:
     """
     Generate a sawtooth waveform with configurable y-axis offset.
@@ -83,13 +138,21 @@ def gen_sawtooth_wf(
         offset: Y-axis offset (0.0-10.0)
         dur: Duration in seconds
         sample_rate: Samples per second
+        time: Time axis from gen_time_axis(dur, sample_rate), to share one
+            array between waveforms; generated when omitted
+        out: Array of the same length as the time axis to write the
+            amplitudes into; a new array is allocated when omitted
 
     Returns:
         Tuple of (time array, amplitude array)
     """
-    time = np.linspace(0, dur, int(sample_rate * dur))
+    if time is None:
+        time = gen_time_axis(dur, sample_rate)
     half_amp = amp / 2
-    wf = offset + half_amp * signal.sawtooth(2 * np.pi * freq * time)
+    # Ramps from -1 to 1 over each period
+    wf = _phase(freq, time, out)
+    wf *= half_amp / np.pi
+    wf += offset - half_amp
     return time, wf
 
 
@@ -98,7 +161,9 @@ def gen_triangle_wf(
     amp: float,
     offset: float = 0.0,
     dur: float = 1.0,
-    sample_rate: int = 1000
+    sample_rate: int = 1000,
+    time: Optional[np.ndarray] = None,
+    out: Optional[np.ndarray] = None
 ) -> Tuple[np.ndarray, np.ndarray]:
     """
     Generate a triangle waveform with configurable y-axis offset.
@@ -109,16 +174,24 @@ def gen_triangle_wf(
         offset: Y-axis offset (0.0-10.0)
         dur: Duration in seconds
         sample_rate: Samples per second
+        time: Time axis from gen_time_axis(dur, sample_rate), to share one
+            array between waveforms; generated when omitted
+        out: Array of the same length as the time axis to write the
+            amplitudes into; a new array is allocated when omitted
 
     Returns:
         Tuple of (time array, amplitude array)
     """
-    time = np.linspace(0, dur, int(sample_rate * dur))
+    if time is None:
+        time = gen_time_axis(dur, sample_rate)
     half_amp = amp / 2
-    wf = offset + half_amp * signal.sawtooth(
-        2 * np.pi * freq * time,
-        width=0.5
-    )
+    # Rises from -1 to 1 over the first half period, falls over the second
+    wf = _phase(freq, time, out)
+    wf *= 2 / np.pi
+    wf -= 2
+    np.abs(wf, out=wf)
+    wf *= -half_amp
+    wf += offset + half_amp
     return time, wf
 
 
@@ -138,8 +211,7 @@ def compute_max_env(
         return np.array([]), np.array([])
 
     time = wfs[0][0]  # Shared time base
-    amps = np.array([w[1] for w in wfs])
-    max_env = np.max(amps, axis=0)
+    max_env = _reduce_amps(wfs, np.maximum)
 
     return time, max_env
 
@@ -160,8 +232,7 @@ def compute_min_env(
         return np.array([]), np.array([])
 
     time = wfs[0][0]  # Shared time base
-    amps = np.array([w[1] for w in wfs])
-    min_env = np.min(amps, axis=0)
+    min_env = _reduce_amps(wfs, np.minimum)
 
     return time, min_env
 
@@ -182,12 +253,79 @@ def compute_rms_env(
         return np.array([]), np.array([])
 
     time = wfs[0][0]  # Shared time base
-    amps = np.array([w[1] for w in wfs])
-    rms_env = np.sqrt(np.mean(amps ** 2, axis=0))
+    # Sum the squares one waveform at a time, reusing one scratch array
+    sq_sum = np.square(wfs[0][1], dtype=float)
+    sq = np.empty_like(sq_sum)
+    for _, amp in wfs[1:]:
+        sq_sum += np.square(amp, out=sq)
+    sq_sum /= len(wfs)
+    rms_env = np.sqrt(sq_sum, out=sq_sum)
 
     return time, rms_env
 
 
+def decimate_indices(values: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Pick sample indices that keep a trace's shape at reduced resolution.
+
+    The samples are split into max_points // 2 bins and the minimum and
+    maximum of each bin are kept, so peaks and edges survive decimation.
+    The first and last samples are always included.
+
+    Args:
+        values: Sample values
+        max_points: Approximate number of samples to keep
+
+    Returns:
+        Sorted array of indices into values
+    """
+    n = len(values)
+    n_bins = max_points // 2
+    if n_bins < 1 or n <= max_points:
+        return np.arange(n)
+
+    bin_len = n // n_bins
+    used = bin_len * n_bins
+    bins = values[:used].reshape(n_bins, bin_len)
+    starts = np.arange(0, used, bin_len)
+    parts = [
+        starts + bins.argmin(axis=1),
+        starts + bins.argmax(axis=1),
+        [0, n - 1],
+    ]
+    if used < n:
+        tail = values[used:]
+        parts.append([used + tail.argmin(), used + tail.argmax()])
+    return np.unique(np.concatenate(parts))
+
+
+def interp_at(
+    x: float, time: np.ndarray, amps: List[np.ndarray]
+) -> List[float]:
+    """
+    Linearly interpolate several amplitude arrays at one time.
+
+    Gives the same values as np.interp(x, time, amp) for each array, but
+    the arrays share the time axis, so it is searched only once.
+
+    Args:
+        x: Time to sample at
+        time: Increasing time array shared by all amplitude arrays
+        amps: Amplitude arrays of the same length as time
+
+    Returns:
+        Value of each amplitude array at x, clamped to the end samples
+        outside the time range
+    """
+    i = int(np.searchsorted(time, x, side='right'))
+    if i <= 0:
+        return [float(amp[0]) for amp in amps]
+    if i >= len(time):
+        return [float(amp[-1]) for amp in amps]
+    frac = (x - time[i - 1]) / (time[i] - time[i - 1])
+    return [float(amp[i - 1] + frac * (amp[i] - amp[i - 1])) for amp in amps]
+
+
 def gen_wf(
     wf_type: str,
     freq: float,
@@ -195,7 +333,9 @@ def gen_wf(
     offset: float = 0.0,
     duty_cycle: float = 50.0,
     dur: float = 1.0,
-    sample_rate: int = 1000
+    sample_rate: int = 1000,
+    time: Optional[np.ndarray] = None,
+    out: Optional[np.ndarray] = None
 ) -> Tuple[np.ndarray, np.ndarray]:
     """
     Generate a waveform based on type.
@@ -208,6 +348,10 @@ def gen_wf(
         duty_cycle: Duty cycle percentage (1.0-100.0, for square only)
         dur: Duration in seconds
         sample_rate: Samples per second
+        time: Time axis from gen_time_axis(dur, sample_rate), to share one
+            array between waveforms; generated when omitted
+        out: Array of the same length as the time axis to write the
+            amplitudes into; a new array is allocated when omitted
 
     Returns:
         Tuple of (time array, amplitude array)
@@ -215,13 +359,13 @@ def gen_wf(
     wf_type = wf_type.lower()
 
     if wf_type == "sine":
-        return gen_sine_wf(freq, amp, offset, dur, sample_rate)
+        return gen_sine_wf(freq, amp, offset, dur, sample_rate, time, out)
     elif wf_type == "square":
-        return gen_square_wf(freq, amp, duty_cycle, offset, dur, sample_rate)
+        return gen_square_wf(freq, amp, duty_cycle, offset, dur, sample_rate, time, out)
     elif wf_type == "sawtooth":
-        return gen_sawtooth_wf(freq, amp, offset, dur, sample_rate)
+        return gen_sawtooth_wf(freq, amp, offset, dur, sample_rate, time, out)
     elif wf_type == "triangle":
-        return gen_triangle_wf(freq, amp, offset, dur, sample_rate)
+        return gen_triangle_wf(freq, amp, offset, dur, sample_rate, time, out)
     else:
         # Default to sine waveform
-        return gen_sine_wf(freq, amp, offset, dur, sample_rate)
+        return gen_sine_wf(freq, amp, offset, dur, sample_rate, time, out)